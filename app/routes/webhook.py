@@ -1,98 +1,248 @@
-from flask import Flask, request, jsonify
-from flask import Flask, request, jsonify
-import threading
-
-# Setup project path
-from utils.common import setup_project_path, setup_logging, validate_project_name
-setup_project_path()
-
-from services import legacy_service as service 
-from utils import report_reader as readReport
-from config import settings as rc
-from constants import SUPPORTED_PROJECTS
-
-app = Flask(__name__)
-logger = setup_logging(__name__)
-
-@app.route("/bot-slack/help", methods=["POST"])
-def send_guid():
-    help_message = """
-    Danh sách các lệnh
-    */run <project>*: Thực thi test project (edpadmin, edpdob, mlm, vkyc)
-    */report <project>*: Xem kết quả mới nhất (edpadmin, edpdob, mlm, vkyc)
-    */stop <project>*: Dừng project đang chạy (edpadmin, edpdob, mlm, vkyc)
-    */help*: Hiển thị danh sách lệnh.
-    """
-    service.send_mess(help_message)
-    return "", 200
-
-@app.route("/bot-slack/run", methods=["POST"])
-def run():
-    project = request.form.get("text", "").strip().lower()
-    is_valid, error_msg = validate_project_name(project)
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from flask import Blueprint, request, jsonify
+
+from utils.common import (
+    validate_project_name, ephemeral_response,
+    encode_ephemeral, json_bytes_response, get_slash_field
+)
+
+from config.settings import Config
+from services.slack_service import get_slack_service
+from services.process_service import ProcessService
+from services.report_service import ReportService
+from constants import SUPPORTED_PROJECTS, RESPONSE_URL_TIMEOUT
+
+bp = Blueprint("slack", __name__)
+logger = logging.getLogger(__name__)
+
+# Initialize services
+slack_service = get_slack_service()
+process_service = ProcessService()
+report_service = ReportService()
+
+# Bounded pools for background jobs so bursts of commands queue up instead of
+# spawning one thread per request
+run_executor = ThreadPoolExecutor(max_workers=Config.BACKGROUND_WORKERS, thread_name_prefix="bot-run")
+deploy_executor = ThreadPoolExecutor(max_workers=Config.BACKGROUND_WORKERS, thread_name_prefix="bot-deploy")
+reply_executor = ThreadPoolExecutor(max_workers=Config.BACKGROUND_WORKERS, thread_name_prefix="bot-reply")
+
+# Keep-alive session for posting delayed replies to Slack's response_url
+response_session = requests.Session()
+response_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+# Static ephemeral error replies, encoded once; each request only wraps the bytes
+EPHEMERAL_ERRORS = {
+    key: encode_ephemeral(text)
+    for key, text in {
+        "run_fail": "❌ Lỗi hệ thống khi chạy project",
+        "report_fail": "❌ Lỗi hệ thống khi tạo báo cáo",
+        "stop_fail": "❌ Lỗi hệ thống khi dừng project",
+        "deploy_fail": "❌ Lỗi hệ thống khi deploy",
+        "empty_image": "❌ Tên image không được để trống",
+    }.items()
+}
+
+# Reply sent by the app-wide error handler when a command view raises
+COMMAND_ERRORS = {
+    "slack.run_command": EPHEMERAL_ERRORS["run_fail"],
+    "slack.report_command": EPHEMERAL_ERRORS["report_fail"],
+    "slack.stop_command": EPHEMERAL_ERRORS["stop_fail"],
+    "slack.deploy_command": EPHEMERAL_ERRORS["deploy_fail"],
+}
+
+# Help text never changes at runtime, so build it once at import
+HELP_MESSAGE = f"""
+🤖 **SLACK BOT AUTOMATION - HƯỚNG DẪN SỬ DỤNG**
+
+📋 **Danh sách lệnh:**
+• `/run <project>` - Chạy test project
+• `/report <project>` - Xem báo cáo mới nhất
+• `/stop <project>` - Dừng project đang chạy
+• `/deploy <image>` - Pull Docker image
+• `/help` - Hiển thị hướng dẫn này
+
+🎯 **Projects được hỗ trợ:** {", ".join(SUPPORTED_PROJECTS)}
+
+💡 **Ví dụ sử dụng:**
+• `/run mlm` - Chạy MLM project
+• `/report vkyc` - Xem báo cáo VKYC
+• `/stop edpadmin` - Dừng EDP Admin
+
+⚠️ **Lưu ý:** Các lệnh có thể mất vài phút để hoàn thành.
+""".strip()
+
+# /help answers inline with this pre-encoded body instead of calling Slack
+HELP_BODY = orjson.dumps({"response_type": "in_channel", "text": HELP_MESSAGE})
+
+class SlackBotAPI:
+    """Main Slack Bot API class"""
+    
+    def __init__(self):
+        # TEMPORARILY COMMENTED - SUPPORTED_PROJECTS causing errors
+        # self.supported_projects = Config.SUPPORTED_PROJECTS
+        self.supported_projects = []  # Temporarily empty to avoid errors
+    
+    def validate_project(self, project: str) -> tuple[bool, str]:
+        """Validate project name
+        
+        Args:
+            project: Project name to validate
+            
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        return validate_project_name(project)
+    
+    def reply_later(self, response_url: str, build_message) -> None:
+        """Build a reply off the request thread and deliver it via response_url
+        
+        Args:
+            response_url: Slack response_url from the slash command payload;
+                falls back to posting in the channel when missing
+            build_message: Callable returning the message text
+        """
+        def deliver():
+            try:
+                message = build_message()
+                if response_url:
+                    response_session.post(
+                        response_url,
+                        json={"response_type": "in_channel", "text": message},
+                        timeout=RESPONSE_URL_TIMEOUT
+                    )
+                else:
+                    slack_service.send_message(message)
+            except Exception as e:
+                logger.error("Error sending delayed response: %s", e)
+        
+        reply_executor.submit(deliver)
     
+    def get_help_message(self) -> str:
+        """Get help message
+        
+        Returns:
+            str: Help message
+        """
+        return HELP_MESSAGE
+
+bot_api = SlackBotAPI()
+
+@bp.route("/bot-slack/help", methods=["POST"])
+def help_command():
+    """Handle help command"""
+    return json_bytes_response(HELP_BODY)
+
+@bp.route("/bot-slack/run", methods=["POST"])
+def run_command():
+    """Handle run command"""
+    project = get_slash_field(request)
+    
+    # Validate project
+    is_valid, error_message = bot_api.validate_project(project)
     if not is_valid:
-        return jsonify({
-            "response_type": "ephemeral",
-            "text": error_msg
-        }), 200
-    
-    service.send_mess(f"✅ Đang chạy project {project}...")
-    # Gửi phản hồi NGAY cho Slack (tránh timeout)
-    threading.Thread(target=run_background_project, args=(project,)).start()
+        return ephemeral_response(error_message)
+    
+    # Send immediate response
+    slack_service.send_message_async(f"🚀 Đang khởi động project {project}...")
+    
+    # Run project in background
+    def run_background():
+        try:
+            result = process_service.run_batch_file(project)
+            if result["success"]:
+                slack_service.send_message_async(f"✅ Project {project} đã hoàn thành thành công!")
+            else:
+                slack_service.send_message_async(result["message"])
+        except Exception as e:
+            logger.error("Background run error for %s: %s", project, e)
+            slack_service.send_message_async(f"❌ Lỗi khi chạy project {project}: {str(e)}")
+    
+    run_executor.submit(run_background)
     return "", 200
 
-@app.route("/bot-slack/report", methods=["POST"])
-def report():
-    project = request.form.get("text", "").strip().lower()
-    is_valid, error_msg = validate_project_name(project)
-
+@bp.route("/bot-slack/report", methods=["POST"])
+def report_command():
+    """Handle report command"""
+    project = get_slash_field(request)
+    
+    # Validate project
+    is_valid, error_message = bot_api.validate_project(project)
     if not is_valid:
-        return jsonify({
-            "response_type": "ephemeral",
-            "text": error_msg
-        }), 200
-
-    mess = readReport.gen_mess(project)
-
-    service.send_mess(mess)
-
+        return ephemeral_response(error_message)
+    
+    # Generate and deliver the report after acknowledging Slack
+    bot_api.reply_later(
+        get_slash_field(request, "response_url", lower=False),
+        lambda: report_service.generate_report_message(project)["message"]
+    )
     return "", 200
 
-@app.route("/bot-slack/stop", methods=["POST"])
-def stop():
-
-    project = request.form.get("text", "").strip().lower()
-
-    if not project or project not in PROJECT_LST:
-        return jsonify({
-            "response_type": "ephemeral",
-            "text": "❌ Project không tồn tại!"
-        }), 200
+@bp.route("/bot-slack/stop", methods=["POST"])
+def stop_command():
+    """Handle stop command"""
+    project = get_slash_field(request)
     
-    service.stop_containers_by_partial_name(project)
-
+    # Validate project
+    is_valid, error_message = bot_api.validate_project(project)
+    if not is_valid:
+        return ephemeral_response(error_message)
+    
+    # Stop containers and processes
+    container_result = process_service.stop_containers_by_name(project)
+    process_result = process_service.stop_project(project)
+    
+    # Combine messages
+    messages = []
+    if container_result["success"]:
+        messages.append(container_result["message"])
+    if process_result["success"]:
+        messages.append(process_result["message"])
+    
+    if not messages:
+        message = f"❌ Không thể dừng project {project}"
+    else:
+        message = "\n".join(messages)
+    
+    # Hand the notification to the dispatcher rather than holding the
+    # request open for Slack's round trip
+    slack_service.send_message_async(message)
     return "", 200
 
-@app.route("/bot-slack/deploy", methods=["POST"])
-def deploy():
-
-    image = request.form.get("image", "").strip().lower()
+@bp.route("/bot-slack/deploy", methods=["POST"])
+def deploy_command():
+    """Handle deploy command"""
+    image = get_slash_field(request, lower=False)
     
-    service.pull_image(image)
-
+    if not image:
+        return json_bytes_response(EPHEMERAL_ERRORS["empty_image"])
+    
+    # Send immediate response
+    slack_service.send_message_async(f"🐳 Đang pull Docker image: {image}...")
+    
+    # Pull image in background
+    def pull_background():
+        try:
+            result = process_service.pull_docker_image(image)
+            slack_service.send_message_async(result["message"])
+        except Exception as e:
+            logger.error("Background pull error for %s: %s", image, e)
+            slack_service.send_message_async(f"❌ Lỗi khi pull image {image}: {str(e)}")
+    
+    deploy_executor.submit(pull_background)
     return "", 200
 
-
-
-def run_background_project(project):
-    try:
-        service.run_project_with_batch(project)
-    except Exception as e:
-        return jsonify({
-            "response_type": "ephemeral",
-            "text": "❗️ Lỗi dừng project"
-        }), 200
-
-if __name__ == "__main__":
-    app.run(debug=True, port=5000)
\ No newline at end of file
+@bp.route("/bot-slack/status", methods=["GET"])
+def status_command():
+    """Handle status command"""
+    running_projects = process_service.get_running_projects()
+    
+    if running_projects:
+        message = f"🔄 **Projects đang chạy:** {', '.join(running_projects)}"
+    else:
+        message = "✅ **Không có project nào đang chạy**"
+    
+    return jsonify({"status": "ok", "message": message}), 200
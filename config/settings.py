@@ -3,8 +3,10 @@ from pathlib import Path
 from dotenv import load_dotenv
 import logging
 from constants import (
-    DEFAULT_LOG_LEVEL, DEFAULT_LOG_FORMAT, DEFAULT_LOG_FILE,
-    SUPPORTED_PROJECTS
+    DEFAULT_LOG_LEVEL, DEFAULT_LOG_FORMAT, DEFAULT_LOG_FILE, LOGS_DIR,
+    SUPPORTED_PROJECTS, SUPPORTED_PROJECTS_SET, DEFAULT_BACKGROUND_WORKERS,
+    DEFAULT_WAITRESS_CONNECTION_LIMIT, DEFAULT_WAITRESS_CHANNEL_TIMEOUT,
+    DEFAULT_WAITRESS_CLEANUP_INTERVAL
 )
 
 # Load environment variables
@@ -37,12 +39,22 @@ class Config:
     
     # Supported Projects
     SUPPORTED_PROJECTS = SUPPORTED_PROJECTS
+    SUPPORTED_PROJECTS_SET = SUPPORTED_PROJECTS_SET
     
     # Logging Configuration
     LOG_LEVEL = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL)
     LOG_FORMAT = DEFAULT_LOG_FORMAT
     LOG_FILE = os.getenv("LOG_FILE", DEFAULT_LOG_FILE)
     
+    # Waitress Configuration
+    WAITRESS_THREADS = int(os.getenv("WAITRESS_THREADS", max(4, os.cpu_count() or 1)))
+    WAITRESS_CONNECTION_LIMIT = int(os.getenv("WAITRESS_CONNECTION_LIMIT", DEFAULT_WAITRESS_CONNECTION_LIMIT))
+    WAITRESS_CHANNEL_TIMEOUT = int(os.getenv("WAITRESS_CHANNEL_TIMEOUT", DEFAULT_WAITRESS_CHANNEL_TIMEOUT))
+    WAITRESS_CLEANUP_INTERVAL = int(os.getenv("WAITRESS_CLEANUP_INTERVAL", DEFAULT_WAITRESS_CLEANUP_INTERVAL))
+    
+    # Background Job Configuration
+    BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", DEFAULT_BACKGROUND_WORKERS))
+    
     @classmethod
     def validate(cls):
         """Validate configuration on startup"""
@@ -70,10 +82,28 @@ class Config:
         
         return True
 
-# Setup logging
-logging.basicConfig(
-    level=getattr(logging, Config.LOG_LEVEL),
-    format=Config.LOG_FORMAT
-)
+_logging_configured = False
+
+def configure_logging():
+    """Configure root logging once per process
+    
+    Module loggers only call logging.getLogger(__name__) and inherit these
+    handlers, so calling this again never attaches duplicates.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    
+    handlers = [logging.StreamHandler()]
+    if Config.LOG_FILE:
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        handlers.append(logging.FileHandler(os.path.join(LOGS_DIR, Config.LOG_FILE)))
+    
+    logging.basicConfig(
+        level=getattr(logging, Config.LOG_LEVEL.upper()),
+        format=Config.LOG_FORMAT,
+        handlers=handlers
+    )
+    _logging_configured = True
 
 logger = logging.getLogger(__name__)
\ No newline at end of file
@@ -7,6 +7,7 @@ DEFAULT_DEBUG_PORT = 5678
 
 # Project Configuration
 SUPPORTED_PROJECTS = ["mlm", "vkyc", "edpadmin", "edpdob"]
+SUPPORTED_PROJECTS_SET: frozenset[str] = frozenset(SUPPORTED_PROJECTS)
 
 # URL Configuration
 DEFAULT_BASE_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
@@ -24,6 +25,20 @@ DEFAULT_REDIS_PORT = 6379
 DEFAULT_WORKER_CONNECTIONS = 1000
 DEFAULT_HTTP_SERVER_PORT = 8080
 
+# Slack API Configuration
+SLACK_API_URL = "https://slack.com/api/"
+SLACK_API_TIMEOUT = 10  # seconds
+SLACK_COALESCE_WINDOW = 0.5  # seconds; queued messages closer than this share one post
+
+# Waitress Configuration (run.py production mode)
+DEFAULT_WAITRESS_CONNECTION_LIMIT = 1000
+DEFAULT_WAITRESS_CHANNEL_TIMEOUT = 120
+DEFAULT_WAITRESS_CLEANUP_INTERVAL = 30
+
+# Background Job Configuration
+DEFAULT_BACKGROUND_WORKERS = 4
+RESPONSE_URL_TIMEOUT = 10  # seconds
+
 # Test Configuration
 TEST_TIMESTAMP = "1234567890.123456"
 TEST_SLACK_WEBHOOK = "https://hooks.slack.com/commands/1234/5678"
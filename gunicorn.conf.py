@@ -0,0 +1,26 @@
+"""Gunicorn configuration for the Bot Slack service
+
+Usage:
+    gunicorn -c gunicorn.conf.py app.main:app
+
+The gevent worker monkey-patches the standard library before the app is
+imported, so outbound Slack HTTP calls yield to other requests instead of
+pinning an OS thread each.
+"""
+
+import os
+
+from constants import DEFAULT_PORT, DEFAULT_WORKER_CONNECTIONS
+
+bind = f"0.0.0.0:{os.getenv('PORT', DEFAULT_PORT)}"
+worker_class = "gevent"
+
+# ProcessService keeps running batch processes in memory, so a single worker
+# process is the default; gevent provides the request concurrency
+workers = int(os.getenv("WORKERS", 1))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", DEFAULT_WORKER_CONNECTIONS))
+timeout = int(os.getenv("WORKER_TIMEOUT", 30))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "INFO").lower()
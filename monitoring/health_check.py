@@ -14,34 +14,86 @@ from config.settings import Config
 from constants import DEFAULT_PORT, DEFAULT_HOST
 
 import time
+import logging
 import psutil
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import smtplib
+from string import Template
 from datetime import datetime, timedelta
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
 from typing import Dict, List, Optional
 import threading
 import os
-from dataclasses import dataclass
+import random
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logger = setup_logging(__name__)
 
-@dataclass
+# How long a full health check result is reused by concurrent callers (seconds)
+_CACHE_TTL = 2.0
+
+# Flush the daily results file after this many buffered lines
+_RESULTS_FLUSH_EVERY = 10
+
+# Log tail scanning: read backwards in chunks until entries predate the window
+_LOG_CHUNK_SIZE = 64 * 1024
+_LOG_TIMESTAMP_RE = re.compile(rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+_LOG_FIRST_TIMESTAMP_RE = re.compile(_LOG_TIMESTAMP_RE.pattern, re.MULTILINE)
+
+# Above this window size, count levels in one Hyperscan pass when available
+_HYPERSCAN_MIN_BYTES = 10 * 1024 * 1024
+
+def _build_level_database():
+    """Compile ERROR/WARNING into one Hyperscan database, or None if unavailable"""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(expressions=[b'ERROR', b'WARNING'], ids=[0, 1], elements=2, flags=[0, 0])
+    return db
+
+_LEVEL_DATABASE = _build_level_database()
+
+def count_log_levels(buf: bytes) -> tuple[int, int]:
+    """Count ERROR and WARNING occurrences in a log buffer
+    
+    Args:
+        buf: Raw log bytes
+        
+    Returns:
+        tuple: (error_count, warning_count)
+    """
+    if _LEVEL_DATABASE is not None and len(buf) > _HYPERSCAN_MIN_BYTES:
+        counts = [0, 0]
+        
+        def on_match(pattern_id, start, end, flags, context):
+            counts[pattern_id] += 1
+        
+        _LEVEL_DATABASE.scan(buf, match_event_handler=on_match)
+        return counts[0], counts[1]
+    return buf.count(b'ERROR'), buf.count(b'WARNING')
+
+@dataclass(frozen=True)
 class HealthStatus:
     """Health status data structure"""
     is_healthy: bool
     response_time: float
     status_code: int
     error_message: Optional[str] = None
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
 
-@dataclass
+@dataclass(frozen=True)
 class SystemMetrics:
     """System metrics data structure"""
     cpu_percent: float
@@ -49,57 +101,108 @@ class SystemMetrics:
     disk_percent: float
     network_io: Dict
     process_count: int
-    timestamp: datetime = None
-    
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = datetime.now()
+    timestamp: datetime = field(default_factory=datetime.now)
+
+def _failed_health_status() -> HealthStatus:
+    """Fallback for a health check that raised, stamped with the failure time"""
+    return HealthStatus(False, 0.0, 0, "Health check failed due to unexpected error")
+
+def _empty_system_metrics() -> SystemMetrics:
+    """Fallback for a metrics read that raised, with its own network_io dict"""
+    return SystemMetrics(
+        cpu_percent=0.0,
+        memory_percent=0.0,
+        disk_percent=0.0,
+        network_io={},
+        process_count=0
+    )
+
+# Email alert body; only severity, time and message vary per alert
+EMAIL_BODY_TEMPLATE = Template("""
+            Alert Details:
+            Severity: $severity
+            Time: $time
+            Service: Bot Slack Service
+            
+            Message:
+            $message
+            
+            --
+            Bot Slack Monitoring System
+            """)
 
 class AlertManager:
     """Manages alerts and notifications"""
     
+    COLOR_MAP = {
+        'INFO': '#36a64f',
+        'WARNING': '#ff9500',
+        'ERROR': '#ff0000',
+        'CRITICAL': '#8B0000'
+    }
+    
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.alert_history = []
-        self.last_alert_time = {}
+        self.alert_history = deque(maxlen=config.get('alert_history_size', 1000))
+        self.last_alert_time: Dict[str, float] = {}
+        self.session = requests.Session()
+        
+        # Channel settings are fixed for the manager's lifetime
+        self._email_enabled = bool(config.get('email', {}).get('enabled'))
+        self._slack_enabled = bool(config.get('slack', {}).get('enabled'))
+        self._webhook_url = config.get('slack', {}).get('webhook_url')
+        self._smtp = None
+        if self._email_enabled:
+            self._email_from = config['email']['from']
+            self._email_to = ', '.join(config['email']['to'])
+    
+    def close(self):
+        """Release pooled webhook and SMTP connections"""
+        self.session.close()
+        if self._smtp is not None:
+            try:
+                self._smtp.quit()
+            except smtplib.SMTPException:
+                pass
+            self._smtp = None
+    
+    def _get_smtp(self) -> smtplib.SMTP:
+        """Return a live SMTP connection, reconnecting if the server dropped it"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._smtp = None
+        
+        smtp_config = self.config['email']
+        server = smtplib.SMTP(smtp_config['smtp_server'], smtp_config['smtp_port'])
+        if smtp_config.get('use_tls', True):
+            server.starttls()
+        if smtp_config.get('username') and smtp_config.get('password'):
+            server.login(smtp_config['username'], smtp_config['password'])
+        self._smtp = server
+        return server
         
     def send_email_alert(self, subject: str, message: str, severity: str = 'WARNING'):
         """Send email alert"""
         try:
-            if not self.config.get('email', {}).get('enabled', False):
+            if not self._email_enabled:
                 return
                 
-            smtp_config = self.config['email']
-            
-            msg = MimeMultipart()
-            msg['From'] = smtp_config['from']
-            msg['To'] = ', '.join(smtp_config['to'])
+            body = EMAIL_BODY_TEMPLATE.substitute(
+                severity=severity,
+                time=datetime.now().isoformat(),
+                message=message
+            )
+            msg = MIMEText(body, 'plain')
+            msg['From'] = self._email_from
+            msg['To'] = self._email_to
             msg['Subject'] = f"[{severity}] Bot Slack Service - {subject}"
             
-            body = f"""
-            Alert Details:
-            Severity: {severity}
-            Time: {datetime.now().isoformat()}
-            Service: Bot Slack Service
-            
-            Message:
-            {message}
-            
-            --
-            Bot Slack Monitoring System
-            """
-            
-            msg.attach(MimeText(body, 'plain'))
-            
-            server = smtplib.SMTP(smtp_config['smtp_server'], smtp_config['smtp_port'])
-            if smtp_config.get('use_tls', True):
-                server.starttls()
-            if smtp_config.get('username') and smtp_config.get('password'):
-                server.login(smtp_config['username'], smtp_config['password'])
-            
-            server.send_message(msg)
-            server.quit()
+            self._get_smtp().send_message(msg)
             
             self.logger.info(f"Email alert sent: {subject}")
             
@@ -109,22 +212,12 @@ class AlertManager:
     def send_slack_alert(self, message: str, severity: str = 'WARNING'):
         """Send Slack alert"""
         try:
-            if not self.config.get('slack', {}).get('enabled', False):
+            if not self._slack_enabled:
                 return
                 
-            slack_config = self.config['slack']
-            webhook_url = slack_config['webhook_url']
-            
-            color_map = {
-                'INFO': '#36a64f',
-                'WARNING': '#ff9500',
-                'ERROR': '#ff0000',
-                'CRITICAL': '#8B0000'
-            }
-            
             payload = {
                 'attachments': [{
-                    'color': color_map.get(severity, '#ff9500'),
+                    'color': self.COLOR_MAP.get(severity, '#ff9500'),
                     'title': f'Bot Slack Service Alert - {severity}',
                     'text': message,
                     'footer': 'Bot Slack Monitoring',
@@ -132,7 +225,7 @@ class AlertManager:
                 }]
             }
             
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = self.session.post(self._webhook_url, json=payload, timeout=10)
             response.raise_for_status()
             
             self.logger.info(f"Slack alert sent: {severity}")
@@ -142,19 +235,22 @@ class AlertManager:
     
     def should_send_alert(self, alert_type: str, cooldown_minutes: int = 30) -> bool:
         """Check if alert should be sent based on cooldown period"""
-        now = datetime.now()
+        now = time.monotonic()
         last_alert = self.last_alert_time.get(alert_type)
         
-        if last_alert is None:
-            self.last_alert_time[alert_type] = now
-            return True
-            
-        if now - last_alert > timedelta(minutes=cooldown_minutes):
+        if last_alert is None or now - last_alert > cooldown_minutes * 60:
             self.last_alert_time[alert_type] = now
+            self._prune_alert_times(now)
             return True
             
         return False
     
+    def _prune_alert_times(self, now: float):
+        """Forget cooldowns older than a day so varied alert types don't pile up"""
+        stale_before = now - 24 * 3600
+        for alert_type in [k for k, t in self.last_alert_time.items() if t < stale_before]:
+            del self.last_alert_time[alert_type]
+    
     def send_alert(self, alert_type: str, message: str, severity: str = 'WARNING'):
         """Send alert through configured channels"""
         if not self.should_send_alert(alert_type):
@@ -168,25 +264,48 @@ class AlertManager:
         })
         
         # Send through configured channels
-        if self.config.get('email', {}).get('enabled', False):
+        if self._email_enabled:
             self.send_email_alert(alert_type, message, severity)
             
-        if self.config.get('slack', {}).get('enabled', False):
+        if self._slack_enabled:
             self.send_slack_alert(message, severity)
 
 class HealthChecker:
     """Performs health checks on the service"""
     
+    ENDPOINTS = ('/health', '/metrics')
+    
     def __init__(self, base_url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"):
         self.base_url = base_url
+        
+        # Keep-alive session so back-to-back probes share one connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            # Retry only connection failures; an HTTP error status is the
+            # probe's answer and must reach the caller unchanged
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
+        
+        # Endpoint probes are independent, so run them side by side
+        self._pool = ThreadPoolExecutor(max_workers=min(8, len(self.ENDPOINTS)), thread_name_prefix='health-probe')
     
-    @handle_exceptions(default_return=HealthStatus(False, 0.0, 0, "Health check failed due to unexpected error"))
+    def close(self):
+        """Release pooled probe connections and worker threads"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+    
+    @handle_exceptions(default_factory=_failed_health_status)
     def check_health_endpoint(self) -> HealthStatus:
         """Check the health endpoint"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        response = requests.get(f'{self.base_url}/health', timeout=10)
-        response_time = time.time() - start_time
+        response = self.session.get(f'{self.base_url}/health', timeout=10)
+        response_time = time.monotonic() - start_time
         
         if response.status_code == 200:
             data = response.json()
@@ -211,50 +330,73 @@ class HealthChecker:
                 error_message=f"HTTP {response.status_code}"
             )
     
+    def _probe(self, endpoint: str) -> HealthStatus:
+        """Probe a single endpoint"""
+        start_time = time.monotonic()
+        try:
+            response = self.session.get(f'{self.base_url}{endpoint}', timeout=5)
+            response_time = time.monotonic() - start_time
+            
+            return HealthStatus(
+                is_healthy=response.status_code == 200,
+                response_time=response_time,
+                status_code=response.status_code,
+                error_message=None if response.status_code == 200 else f"HTTP {response.status_code}"
+            )
+        except Exception as e:
+            return HealthStatus(
+                is_healthy=False,
+                response_time=time.monotonic() - start_time,
+                status_code=0,
+                error_message=str(e)
+            )
+    
     def check_endpoints(self) -> Dict[str, HealthStatus]:
-        """Check multiple endpoints"""
-        endpoints = ['/health', '/metrics']
+        """Check multiple endpoints concurrently
+        
+        If one probe cannot reach the service at all, probes that have not
+        started yet are cancelled and reported as skipped.
+        """
+        futures = {self._pool.submit(self._probe, endpoint): endpoint for endpoint in self.ENDPOINTS}
         results = {}
         
-        for endpoint in endpoints:
-            start_time = time.time()
-            try:
-                response = requests.get(f'{self.base_url}{endpoint}', timeout=5)
-                response_time = time.time() - start_time
-                
-                results[endpoint] = HealthStatus(
-                    is_healthy=response.status_code == 200,
-                    response_time=response_time,
-                    status_code=response.status_code,
-                    error_message=None if response.status_code == 200 else f"HTTP {response.status_code}"
-                )
-            except Exception as e:
-                results[endpoint] = HealthStatus(
-                    is_healthy=False,
-                    response_time=time.time() - start_time,
-                    status_code=0,
-                    error_message=str(e)
-                )
+        for future in as_completed(futures):
+            status = future.result()
+            results[futures[future]] = status
+            if status.status_code == 0:
+                for pending in futures:
+                    if pending.cancel():
+                        results[futures[pending]] = HealthStatus(
+                            is_healthy=False,
+                            response_time=0.0,
+                            status_code=0,
+                            error_message="Skipped: service unreachable"
+                        )
+                break
         
-        return results
+        # Collect any probes that were already running when we stopped early
+        for future, endpoint in futures.items():
+            if endpoint not in results:
+                results[endpoint] = future.result()
+        
+        return {endpoint: results[endpoint] for endpoint in self.ENDPOINTS}
 
 class SystemMonitor:
     """Monitors system resources"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.disk_root = 'C:' if os.name == 'nt' else '/'
+        self._has_procfs = os.path.isdir('/proc/self')
+        
+        # Prime the CPU counter; later calls return usage since the previous one
+        psutil.cpu_percent(interval=None)
     
-    @handle_exceptions(default_return=SystemMetrics(
-        cpu_percent=0.0,
-        memory_percent=0.0,
-        disk_percent=0.0,
-        network_io={},
-        process_count=0
-    ))
+    @handle_exceptions(default_factory=_empty_system_metrics)
     def get_system_metrics(self) -> SystemMetrics:
         """Get current system metrics"""
         # Get network I/O stats
-        net_io = psutil.net_io_counters()
+        net_io = psutil.net_io_counters(pernic=False)
         network_io = {
             'bytes_sent': net_io.bytes_sent,
             'bytes_recv': net_io.bytes_recv,
@@ -263,13 +405,19 @@ class SystemMonitor:
         }
         
         return SystemMetrics(
-            cpu_percent=psutil.cpu_percent(interval=1),
+            cpu_percent=psutil.cpu_percent(interval=None),
             memory_percent=psutil.virtual_memory().percent,
-            disk_percent=psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent,
+            disk_percent=psutil.disk_usage(self.disk_root).percent,
             network_io=network_io,
-            process_count=len(psutil.pids())
+            process_count=self._process_count()
         )
     
+    def _process_count(self) -> int:
+        """Count processes; on Linux one /proc readdir, no per-pid lookups"""
+        if self._has_procfs:
+            return sum(1 for name in os.listdir('/proc') if name[0].isdigit())
+        return len(psutil.pids())
+    
     def check_resource_thresholds(self, metrics: SystemMetrics, thresholds: Dict) -> List[str]:
         """Check if metrics exceed thresholds"""
         alerts = []
@@ -291,37 +439,108 @@ class LogAnalyzer:
     def __init__(self, log_file: str = 'logs/app.log'):
         self.log_file = log_file
         self.logger = logging.getLogger(__name__)
+        
+        # Last analysis, reusable while the file is untouched and none of
+        # its entries have aged out of the window
+        self._last_stat = None
+        self._last_minutes = None
+        self._last_oldest_key = None
+        self._last_result = None
+    
+    def _read_recent(self, cutoff_key: bytes) -> bytes:
+        """Read the tail of the log written at or after cutoff_key
+        
+        Scans backwards from the end of the file and stops at the first line
+        whose timestamp is older than the cutoff. Timestamps are compared as
+        bytes since the log format sorts lexicographically.
+        
+        Args:
+            cutoff_key: Cutoff formatted as b'YYYY-MM-DD HH:MM:SS'
+            
+        Returns:
+            bytes: Log content inside the window
+        """
+        with open(self.log_file, 'rb') as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            window_start = 0
+            carry = b''  # partial line at the front of the previous chunk
+            
+            while pos > 0:
+                step = min(_LOG_CHUNK_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                lines = (f.read(step) + carry).split(b'\n')
+                if pos > 0:
+                    carry = lines.pop(0)
+                    line_end = pos + len(carry) + 1
+                else:
+                    carry = b''
+                    line_end = 0
+                
+                # Walk this chunk's complete lines newest-first
+                line_end += sum(len(line) + 1 for line in lines)
+                found = False
+                for line in reversed(lines):
+                    line_end -= len(line) + 1
+                    match = _LOG_TIMESTAMP_RE.match(line)
+                    if match and match.group(1) < cutoff_key:
+                        window_start = line_end + len(line) + 1
+                        found = True
+                        break
+                if found:
+                    break
+            
+            f.seek(window_start)
+            return f.read(end - window_start)
+    
+    @staticmethod
+    def _last_errors(buf: bytes, limit: int) -> List[str]:
+        """Return up to `limit` of the newest lines containing ERROR, oldest first"""
+        errors = []
+        end = len(buf)
+        while len(errors) < limit:
+            idx = buf.rfind(b'ERROR', 0, end)
+            if idx == -1:
+                break
+            start = buf.rfind(b'\n', 0, idx) + 1
+            stop = buf.find(b'\n', idx)
+            errors.append(buf[start:stop if stop != -1 else len(buf)].strip().decode('utf-8', 'replace'))
+            end = start
+        errors.reverse()
+        return errors
     
     def analyze_recent_logs(self, minutes: int = 10) -> Dict:
         """Analyze logs from the last N minutes"""
         try:
-            if not os.path.exists(self.log_file):
+            try:
+                st = os.stat(self.log_file)
+            except FileNotFoundError:
                 return {'error': 'Log file not found'}
             
             cutoff_time = datetime.now() - timedelta(minutes=minutes)
-            error_count = 0
-            warning_count = 0
-            recent_errors = []
+            cutoff_key = cutoff_time.strftime('%Y-%m-%d %H:%M:%S').encode()
             
-            with open(self.log_file, 'r') as f:
-                for line in f:
-                    try:
-                        # Simple log parsing - adjust based on your log format
-                        if 'ERROR' in line:
-                            error_count += 1
-                            if len(recent_errors) < 5:  # Keep last 5 errors
-                                recent_errors.append(line.strip())
-                        elif 'WARNING' in line:
-                            warning_count += 1
-                    except Exception:
-                        continue
+            sig = (st.st_ino, st.st_size, st.st_mtime_ns)
+            if (sig == self._last_stat and minutes == self._last_minutes
+                    and (self._last_oldest_key is None or self._last_oldest_key >= cutoff_key)):
+                return self._last_result
             
-            return {
+            buf = self._read_recent(cutoff_key)
+            oldest = _LOG_FIRST_TIMESTAMP_RE.search(buf)
+            error_count, warning_count = count_log_levels(buf)
+            
+            result = {
                 'error_count': error_count,
                 'warning_count': warning_count,
-                'recent_errors': recent_errors,
+                'recent_errors': self._last_errors(buf, 5),
                 'analysis_period_minutes': minutes
             }
+            self._last_stat = sig
+            self._last_minutes = minutes
+            self._last_oldest_key = oldest.group(1) if oldest else None
+            self._last_result = result
+            return result
             
         except Exception as e:
             self.logger.error(f"Error analyzing logs: {e}")
@@ -332,13 +551,31 @@ class ServiceMonitor:
     
     def __init__(self, config_file: str = 'monitoring_config.json'):
         self.config = self.load_config(config_file)
+        # Config never changes after load; encode it once for status output,
+        # indented to sit one level deep in the status document
+        self._config_json = orjson.dumps(self.config, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
         self.health_checker = HealthChecker(self.config.get('service_url', 'http://localhost:5000'))
         self.system_monitor = SystemMonitor()
         self.log_analyzer = LogAnalyzer(self.config.get('log_file', 'logs/app.log'))
         self.alert_manager = AlertManager(self.config.get('alerts', {}))
         self.logger = logging.getLogger(__name__)
         self.running = False
-        self.monitor_thread = None
+        self._timer = None
+        self._tick_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._consecutive_failures = 0
+        self._cache = {}
+        self._cache_ts = {}
+        self._cache_lock = threading.Lock()
+        self._check_pool = self._new_check_pool()
+        self._results_fp = None
+        self._results_date = None
+        self._results_pending = 0
+    
+    @staticmethod
+    def _new_check_pool() -> ThreadPoolExecutor:
+        """Workers that run the metrics and log probes alongside the HTTP check"""
+        return ThreadPoolExecutor(max_workers=2, thread_name_prefix='monitor-check')
     
     def load_config(self, config_file: str) -> Dict:
         """Load monitoring configuration"""
@@ -381,14 +618,37 @@ class ServiceMonitor:
         
         return default_config
     
-    def perform_health_check(self) -> Dict:
-        """Perform comprehensive health check"""
+    def perform_health_check(self, use_cache: bool = True) -> Dict:
+        """Perform comprehensive health check
+        
+        Args:
+            use_cache: Reuse a result younger than _CACHE_TTL seconds
+            
+        Returns:
+            Dict: Check results
+        """
+        with self._cache_lock:
+            if use_cache and time.monotonic() - self._cache_ts.get('full', 0) < _CACHE_TTL:
+                return self._cache['full']
+            
+            results = self._run_health_check()
+            self._cache['full'] = results
+            self._cache_ts['full'] = time.monotonic()
+            return results
+    
+    def _run_health_check(self) -> Dict:
+        """Run every probe and raise alerts for a fresh health check"""
         results = {
             'timestamp': datetime.now().isoformat(),
             'overall_healthy': True,
             'checks': {}
         }
         
+        # Metrics and log analysis don't depend on the HTTP probe; run them
+        # alongside it so one check takes as long as its slowest part
+        metrics_future = self._check_pool.submit(self.system_monitor.get_system_metrics)
+        logs_future = self._check_pool.submit(self.log_analyzer.analyze_recent_logs)
+        
         # Check main health endpoint
         health_status = self.health_checker.check_health_endpoint()
         results['checks']['health_endpoint'] = {
@@ -416,7 +676,7 @@ class ServiceMonitor:
         
         # Check system metrics
         try:
-            metrics = self.system_monitor.get_system_metrics()
+            metrics = metrics_future.result()
             results['checks']['system_metrics'] = {
                 'cpu_percent': metrics.cpu_percent,
                 'memory_percent': metrics.memory_percent,
@@ -437,7 +697,7 @@ class ServiceMonitor:
             results['overall_healthy'] = False
         
         # Analyze logs
-        log_analysis = self.log_analyzer.analyze_recent_logs()
+        log_analysis = logs_future.result()
         results['checks']['log_analysis'] = log_analysis
         
         if log_analysis.get('error_count', 0) > 10:  # More than 10 errors in last 10 minutes
@@ -449,16 +709,19 @@ class ServiceMonitor:
         
         return results
     
-    def monitor_loop(self):
-        """Main monitoring loop"""
-        self.logger.info("Starting monitoring loop")
-        
-        while self.running:
+    def _tick(self):
+        """Run one check, then schedule the next on a fresh timer"""
+        with self._tick_lock:
+            if self._stop_event.is_set():
+                return
+            
+            healthy = False
             try:
                 results = self.perform_health_check()
+                healthy = results['overall_healthy']
                 
                 # Log results
-                if results['overall_healthy']:
+                if healthy:
                     self.logger.info("Health check passed")
                 else:
                     self.logger.warning(f"Health check failed: {results}")
@@ -474,40 +737,91 @@ class ServiceMonitor:
                     'ERROR'
                 )
             
-            # Wait for next check
-            time.sleep(self.config['check_interval'])
+            if not self._stop_event.is_set():
+                self._schedule(self._next_interval(healthy))
+    
+    def _schedule(self, delay: float):
+        """Arm a one-shot timer for the next check"""
+        self._timer = threading.Timer(delay, self._tick)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _next_interval(self, healthy: bool) -> float:
+        """Seconds until the next check
+        
+        Consecutive failures back off exponentially (with jitter) up to
+        max_backoff_interval so a struggling service isn't probed harder.
+        """
+        interval = self.config['check_interval']
+        if healthy:
+            self._consecutive_failures = 0
+            return interval
+        
+        backoff = min(interval * 2 ** self._consecutive_failures, self.config.get('max_backoff_interval', 600))
+        self._consecutive_failures += 1
+        return backoff + random.uniform(0, 5)
     
     def save_monitoring_results(self, results: Dict):
-        """Save monitoring results to file"""
+        """Save monitoring results to file
+        
+        The daily file stays open between checks and is flushed every
+        _RESULTS_FLUSH_EVERY lines, on rollover and on stop().
+        """
         try:
-            os.makedirs('monitoring', exist_ok=True)
-            filename = f"monitoring/health_check_{datetime.now().strftime('%Y%m%d')}.json"
+            today = datetime.now().strftime('%Y%m%d')
+            if today != self._results_date:
+                self._close_results_file()
+                os.makedirs('monitoring', exist_ok=True)
+                self._results_fp = open(f"monitoring/health_check_{today}.json", 'ab', buffering=65536)
+                self._results_date = today
             
             # Append to daily file
-            with open(filename, 'a') as f:
-                f.write(json.dumps(results) + '\n')
+            self._results_fp.write(orjson.dumps(results) + b'\n')
+            self._results_pending += 1
+            if self._results_pending >= _RESULTS_FLUSH_EVERY:
+                self._results_fp.flush()
+                self._results_pending = 0
                 
         except Exception as e:
             self.logger.error(f"Error saving monitoring results: {e}")
     
+    def _close_results_file(self):
+        """Flush and close the current daily results file"""
+        if self._results_fp is not None:
+            self._results_fp.close()
+            self._results_fp = None
+            self._results_date = None
+            self._results_pending = 0
+    
     def start(self):
         """Start monitoring"""
         if self.running:
             return
             
         self.running = True
-        self.monitor_thread = threading.Thread(target=self.monitor_loop)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        if self._stop_event.is_set():
+            # stop() shut the previous pool down and it cannot be reused
+            self._check_pool = self._new_check_pool()
+        self._stop_event.clear()
+        self._schedule(0)
         
         self.logger.info("Monitoring started")
     
     def stop(self):
         """Stop monitoring"""
         self.running = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=10)
+        self._stop_event.set()
+        if self._timer:
+            self._timer.cancel()
+        
+        # Let a check that is already running finish before releasing resources
+        with self._tick_lock:
+            self._timer = None
         
+        self._check_pool.shutdown(wait=False)
+        self._close_results_file()
+        self.health_checker.close()
+        self.alert_manager.close()
         self.logger.info("Monitoring stopped")
     
     def get_status(self) -> Dict:
@@ -517,6 +831,18 @@ class ServiceMonitor:
             'config': self.config,
             'last_check': self.perform_health_check()
         }
+    
+    def format_status(self) -> str:
+        """Render get_status() as indented JSON, reusing the pre-encoded config"""
+        last_check = orjson.dumps(
+            self.perform_health_check(), option=orjson.OPT_INDENT_2, default=str
+        ).replace(b'\n', b'\n  ')
+        return (
+            b'{\n  "running": ' + (b'true' if self.running else b'false')
+            + b',\n  "config": ' + self._config_json
+            + b',\n  "last_check": ' + last_check
+            + b'\n}'
+        ).decode()
 
 def main():
     """Main function for standalone monitoring"""
@@ -543,7 +869,7 @@ def main():
     
     if args.once:
         # Run once and print results
-        results = monitor.perform_health_check()
+        results = monitor.perform_health_check(use_cache=False)
         print(json.dumps(results, indent=2))
     elif args.daemon:
         # Run as daemon
@@ -562,8 +888,7 @@ def main():
             while True:
                 command = input("\nEnter command (status/stop/quit): ").strip().lower()
                 if command == 'status':
-                    status = monitor.get_status()
-                    print(json.dumps(status, indent=2, default=str))
+                    print(monitor.format_status())
                 elif command in ['stop', 'quit']:
                     break
         except KeyboardInterrupt:
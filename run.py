@@ -26,16 +26,34 @@ logger = setup_logging(__name__)
 # Create config instance
 config = Config()
 
-def run_development():
-    """Run the application in development mode"""
+def run_development(reload=False):
+    """Run the application in development mode
+    
+    Serves through Waitress like production; the Werkzeug server with its
+    reloader is only used when reload is requested.
+    """
     logger.info("Starting application in development mode...")
     
     try:
-        app.run(
-            host='0.0.0.0',
-            port=DEFAULT_PORT,
-            debug=True
-        )
+        if reload:
+            app.run(
+                host='0.0.0.0',
+                port=DEFAULT_PORT,
+                debug=True,
+                use_reloader=True
+            )
+        else:
+            app.config['DEBUG'] = True
+            serve(
+                app,
+                host='0.0.0.0',
+                port=DEFAULT_PORT,
+                threads=2,
+                connection_limit=100,
+                cleanup_interval=10,
+                channel_timeout=30,
+                ident='bot-dev'
+            )
     except Exception as e:
         logger.error(f"Failed to start development server: {e}")
         raise
@@ -49,7 +67,12 @@ def run_production():
             app,
             host='0.0.0.0',
             port=DEFAULT_PORT,
-            threads=4
+            threads=config.WAITRESS_THREADS,
+            connection_limit=config.WAITRESS_CONNECTION_LIMIT,
+            cleanup_interval=config.WAITRESS_CLEANUP_INTERVAL,
+            channel_timeout=config.WAITRESS_CHANNEL_TIMEOUT,
+            asyncore_use_poll=True,
+            ident='bot-prod'
         )
     except Exception as e:
         logger.error(f"Failed to start production server: {e}")
@@ -64,16 +87,14 @@ def run_custom(host, port, debug, workers):
     logger.info(f"   Workers: {workers}")
     
     try:
-        if workers > 1:
-            logger.info(f"Using Waitress with {workers} threads")
-            serve(
-                app,
-                host=host,
-                port=port,
-                threads=workers
-            )
-        else:
-            app.run(host=host, port=port, debug=debug)
+        app.config['DEBUG'] = debug
+        logger.info(f"Using Waitress with {max(1, workers)} threads")
+        serve(
+            app,
+            host=host,
+            port=port,
+            threads=max(1, workers)
+        )
     except Exception as e:
         logger.error(f"Failed to start custom server: {e}")
         raise
@@ -113,6 +134,11 @@ def main():
         action='store_true',
         help='Enable debug mode'
     )
+    parser.add_argument(
+        '--reload', 
+        action='store_true',
+        help='Use the Flask dev server with auto-reload (dev mode only)'
+    )
     parser.add_argument(
         '--workers', 
         type=int, 
@@ -138,7 +164,7 @@ def main():
     # Run based on mode
     try:
         if args.mode == 'dev':
-            run_development()
+            run_development(args.reload)
         elif args.mode == 'prod':
             run_production()
         elif args.mode == 'custom':
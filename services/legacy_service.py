@@ -1,21 +1,21 @@
 import subprocess
+from collections import deque
+from types import MappingProxyType
 from flask import jsonify
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from config import settings as rc
+from utils.common import wait_for_exit, batch_command
+from services.slack_service import get_slack_service
 
 # Biến toàn cục giữ tiến trình đang chạy
 current_process = None
 
-RUN_PROJECT = {
+# Bảng project -> file .bat cố định, chỉ đọc
+RUN_PROJECT = MappingProxyType({
     "mlm": rc.RUN_MLM_BAT,
     "vkyc": rc.RUN_VKYC_BAT,
     "edpadmin": rc.RUN_EDP_ADMIN_BAT,
     "edpdob": rc.RUN_EDP_DOB_BAT
-}
+})
 # ---------------------------
 # STOP CONTAINER BY NAME
 # ---------------------------
@@ -27,30 +27,30 @@ def stop_containers_by_partial_name(keyword):
     try:
         # Lấy danh sách container đang chạy
         list_cmd = ["docker", "ps", "--format", "{{.ID}} {{.Names}}"]
-        result = subprocess.run(list_cmd, capture_output=True, text=True)
+        result = subprocess.run(list_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
 
         if result.returncode != 0:
             mess = "❌ Không thể lấy danh sách container."
             return jsonify({"message": mess})
 
-        containers = result.stdout.strip().split("\n")
+        # So khớp trên bytes, chỉ decode tên container khi trùng
+        keyword_b = keyword.lower().encode()
 
-        for line in containers:
-            if not line.strip():
+        for line in result.stdout.splitlines():
+            container_id, _, name_b = line.strip().partition(b" ")
+            if not name_b or keyword_b not in name_b.lower():
                 continue
 
-            container_id, container_name = line.strip().split(maxsplit=1)
+            container_name = name_b.decode()
+            stop_cmd = ["docker", "stop", container_id.decode()]
+            stop_result = subprocess.run(stop_cmd, capture_output=True, text=True)
 
-            if keyword.lower() in container_name.lower():
-                stop_cmd = ["docker", "stop", container_id]
-                stop_result = subprocess.run(stop_cmd, capture_output=True, text=True)
-
-                if stop_result.returncode == 0:
-                    stopped.append(container_name)
-                else:
-                    errors.append(
-                        f"❌ Lỗi khi dừng {container_name}: {stop_result.stderr.strip()}"
-                    )
+            if stop_result.returncode == 0:
+                stopped.append(container_name)
+            else:
+                errors.append(
+                    f"❌ Lỗi khi dừng {container_name}: {stop_result.stderr.strip()}"
+                )
 
         if not stopped and not errors:
             mess = f"⚠️ Project '{keyword}' đang không chạy."
@@ -70,16 +70,19 @@ def stop_containers_by_partial_name(keyword):
 # ---------------------------
 def run_project_with_batch(project):
     global current_process
-    filePath = RUN_PROJECT[project]
+    filePath = RUN_PROJECT.get(project)
+    if filePath is None:
+        print(f"⚠️ Project '{project}' không được hỗ trợ")
+        return
     try:
         current_process = subprocess.Popen(
-            filePath,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
+            batch_command(filePath),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT
         )
-        # Đọc log và in log chạy projectproject
+        # Output không được đọc nên bỏ vào DEVNULL, tránh batch bị treo khi
+        # pipe đầy 64KB. Muốn in log thì đổi lại stdout=PIPE, text=True,
+        # bufsize=1 (line-buffered) và bật vòng lặp dưới.
         # for line in current_process.stdout:
         #     print(f"[Batch Output] {line.strip()}")
 
@@ -105,10 +108,15 @@ def stop_current_process():
     if current_process and current_process.poll() is None:
         current_process.terminate()
         try:
-            current_process.wait(timeout=5)
+            wait_for_exit(current_process, timeout=5)
             print("✅ Process đã được dừng.")
         except subprocess.TimeoutExpired:
             current_process.kill()
+            # Thu hồi tiến trình sau khi kill để không để lại zombie
+            try:
+                wait_for_exit(current_process, timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
             print("❌ Process bị kill do không phản hồi.")
     else:
         print("⚠️ Không có process nào đang chạy.")
@@ -121,22 +129,22 @@ def stop_current_process():
 def pull_image(image_name):
     message = ""
     try:
-        # Tạo câu lệnh pull
-        cmd = f"docker pull {image_name}"
+        # Tạo câu lệnh pull (không qua shell)
+        cmd = ["docker", "pull", image_name]
 
         # Chạy lệnh
         current_process = subprocess.Popen(
             cmd,
-            shell=True,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
+            stderr=subprocess.STDOUT
         )
 
-        output_lines = []
-        for line in current_process.stdout:
-            print(f"[Docker Output] {line.strip()}")
-            output_lines.append(line.strip())
+        # Chỉ giữ 20 dòng cuối để báo lỗi, không tích luỹ toàn bộ progress
+        output_lines = deque(maxlen=20)
+        for raw in iter(current_process.stdout.readline, b""):
+            line = raw.decode("utf-8", errors="replace").strip()
+            print(f"[Docker Output] {line}")
+            output_lines.append(line)
 
         current_process.wait()
         exit_code = current_process.returncode
@@ -153,14 +161,18 @@ def pull_image(image_name):
 # ---------------------------
 # GỬI TIN NHẮN SLACK
 # ---------------------------
-def send_mess(mess):
-    client = WebClient(token=rc.TOKEN_SLACK)
-    try:
-        client.chat_postMessage(channel=rc.GROUP_ID_SLACK, text=mess)
-    except SlackApiError as e:
-        print(f"❌ Gửi tin nhắn thất bại: {e.response['error']}")
-    except Exception as e:
-        print(f"❌ Lỗi không xác định: {str(e)}")
+def send_mess(mess, urgent=False):
+    # Thông báo thường được gom lại và gửi nền; urgent gửi ngay nhưng
+    # vẫn chạy trên thread của Slack để không chặn người gọi
+    if not urgent:
+        get_slack_service().send_message_async(mess)
+        return
+
+    def report(future):
+        if not future.result():
+            print("❌ Gửi tin nhắn thất bại")
+
+    get_slack_service().send_message_now(mess).add_done_callback(report)
 
 
 # ---------------------------
@@ -1,23 +1,164 @@
+import os
+import re
+import select
 import subprocess
 import threading
 import time
 import logging
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Callable
+import requests
 
-# Setup project path
-from utils.common import setup_project_path, setup_logging, handle_exceptions, create_response_dict
-setup_project_path()
+try:
+    import docker
+except ImportError:
+    docker = None
+
+from utils.common import setup_logging, handle_exceptions, create_response_dict, wait_for_exit, batch_command
 
 from config.settings import Config
 
 logger = setup_logging(__name__)
 
+# Upper bound on one epoll wait, so the monitor thread never blocks indefinitely
+_POLL_TIMEOUT = 1.0
+
+def _epoll_usable() -> bool:
+    """Whether children can be reaped from the shared pidfd/epoll thread
+    
+    gevent's monkey.patch_all() removes select.epoll and turns threads into
+    greenlets, where a blocking epoll wait would stall the hub; children
+    then get a waiter each, which gevent's patched Popen.wait() cooperates with.
+    """
+    if not hasattr(os, "pidfd_open") or not hasattr(select, "epoll"):
+        return False
+    try:
+        from gevent import monkey
+    except ImportError:
+        return True
+    return not monkey.is_module_patched("threading")
+
+class ProcessMonitor:
+    """Reap child processes from one thread and report their exit codes
+    
+    Every registered child gets a pidfd in a shared epoll set, so a single
+    thread waits on any number of children. Where pidfds or epoll are not
+    available, or gevent has patched threading, each child falls back to
+    its own waiter thread.
+    """
+    
+    def __init__(self):
+        self._epoll = None
+        self._thread = None
+        self._watched: Dict[int, Tuple[str, subprocess.Popen, Callable]] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, name: str, process: subprocess.Popen,
+                 on_exit: Callable[[str, subprocess.Popen, int], None]) -> None:
+        """Call on_exit(name, process, exit_code) once process has exited
+        
+        Args:
+            name: Label passed back to the callback
+            process: Child process to watch
+            on_exit: Callback run on the monitor thread
+        """
+        if not _epoll_usable():
+            self._start_waiter(name, process, on_exit)
+            return
+        
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            self._start_waiter(name, process, on_exit)
+            return
+        
+        try:
+            with self._lock:
+                if self._thread is None:
+                    self._epoll = select.epoll()
+                    self._thread = threading.Thread(
+                        target=self._loop, name="process-monitor", daemon=True
+                    )
+                    self._thread.start()
+                self._epoll.register(pidfd, select.EPOLLIN)
+                self._watched[pidfd] = (name, process, on_exit)
+        except Exception as e:
+            os.close(pidfd)
+            logger.warning(f"Falling back to a waiter thread for {name}: {str(e)}")
+            self._start_waiter(name, process, on_exit)
+    
+    def _start_waiter(self, name: str, process: subprocess.Popen, on_exit: Callable) -> None:
+        """Watch one child from its own thread"""
+        threading.Thread(
+            target=self._wait_blocking,
+            args=(name, process, on_exit),
+            daemon=True
+        ).start()
+    
+    def _loop(self) -> None:
+        """Monitor thread: dispatch exits as the kernel reports them"""
+        while True:
+            # One bad event must not kill the only reaper; epoll is
+            # level-triggered, so exits left unhandled come back next poll
+            try:
+                for pidfd, _ in self._epoll.poll(timeout=_POLL_TIMEOUT):
+                    with self._lock:
+                        self._epoll.unregister(pidfd)
+                        name, process, on_exit = self._watched.pop(pidfd)
+                    os.close(pidfd)
+                    self._finish(name, process, on_exit)
+            except Exception as e:
+                logger.error(f"Error in process monitor loop: {str(e)}")
+    
+    def _wait_blocking(self, name: str, process: subprocess.Popen, on_exit: Callable) -> None:
+        """Fallback waiter for platforms without pidfd/epoll"""
+        process.wait()
+        self._finish(name, process, on_exit)
+    
+    @staticmethod
+    def _finish(name: str, process: subprocess.Popen, on_exit: Callable) -> None:
+        """Reap the child and hand its exit code to the callback"""
+        try:
+            on_exit(name, process, process.wait())
+        except Exception as e:
+            logger.error(f"Error handling exit of {name}: {str(e)}")
+
+
+# One monitor thread shared by every ProcessService
+_monitor = ProcessMonitor()
+
 class ProcessService:
     """Service for managing processes and Docker containers"""
     
     def __init__(self):
         self._running_processes: Dict[str, subprocess.Popen] = {}
         self._process_lock = threading.Lock()
+        # The Docker client is opened on first use so importing the routes
+        # never waits on the daemon socket
+        self._docker_client = None
+        self._docker_connected = False
+        self._docker_lock = threading.Lock()
+    
+    @property
+    def _docker(self):
+        """Docker SDK client, connected on first use; None means use the CLI"""
+        if not self._docker_connected:
+            with self._docker_lock:
+                if not self._docker_connected:
+                    self._docker_client = self._connect_docker()
+                    self._docker_connected = True
+        return self._docker_client
+    
+    @staticmethod
+    def _connect_docker():
+        """Open a pooled Docker SDK client, or None to fall back to the CLI"""
+        if docker is None:
+            return None
+        try:
+            return docker.from_env(max_pool_size=16)
+        except docker.errors.DockerException as e:
+            logger.warning(f"Docker SDK unavailable, using docker CLI: {str(e)}")
+            return None
     
     @handle_exceptions(default_return={"success": False, "message": "❌ Lỗi không xác định"})
     def run_batch_file(self, project: str) -> Dict[str, Any]:
@@ -29,7 +170,7 @@ class ProcessService:
         Returns:
             dict: Result with status and message
         """
-        if project not in Config.SUPPORTED_PROJECTS:
+        if project not in Config.SUPPORTED_PROJECTS_SET:
             return create_response_dict(
                 False, 
                 f"❌ Project '{project}' không được hỗ trợ"
@@ -50,56 +191,28 @@ class ProcessService:
                     f"❌ Project '{project}' đang chạy"
                 )
             
-            # Start the batch process
+            # Start the batch process. Nothing reads its output, so discard
+            # it rather than let the child stall on a full pipe
             process = subprocess.Popen(
-                batch_path,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                batch_command(batch_path),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             
             self._running_processes[project] = process
+            try:
+                _monitor.register(project, process, self._on_process_exit)
+            except Exception:
+                # Unwatched, the entry would never clear; don't leave the child behind either
+                del self._running_processes[project]
+                process.kill()
+                raise
             logger.info(f"Started batch file for project {project}: {batch_path}")
             
             return create_response_dict(
                 True,
                 f"✅ Đã bắt đầu chạy project {project}"
             )
-        #         # Stop existing process if running
-        #         if project in self._running_processes:
-        #             self._stop_process(project)
-        #         
-        #         # Start new process
-        #         process = subprocess.Popen(
-        #             batch_path,
-        #             shell=True,
-        #             stdout=subprocess.PIPE,
-        #             stderr=subprocess.STDOUT,
-        #             text=True,
-        #             cwd=None
-        #         )
-        #         
-        #         self._running_processes[project] = process
-        #         logger.info(f"Started batch process for project: {project}")
-        #     
-        #     # Wait for process completion in background
-        #     threading.Thread(
-        #         target=self._monitor_process,
-        #         args=(project, process),
-        #         daemon=True
-        #     ).start()
-        #     
-        #     return {
-        #         "success": True,
-        #         "message": f"✅ Đã bắt đầu chạy project {project}"
-        #     }
-        #     
-        # except Exception as e:
-        #     logger.error(f"Error running batch file for {project}: {str(e)}")
-        #     return {
-        #         "success": False,
-        #         "message": f"❌ Lỗi khi chạy project {project}: {str(e)}"
-        #     }
     
     def stop_containers_by_name(self, keyword: str) -> Dict[str, Any]:
         """Stop Docker containers by partial name match
@@ -111,45 +224,10 @@ class ProcessService:
             dict: Result with status and message
         """
         try:
-            # Get running containers
-            list_cmd = ["docker", "ps", "--format", "{{.ID}} {{.Names}}"]
-            result = subprocess.run(list_cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0:
-                return {
-                    "success": False,
-                    "message": "❌ Không thể lấy danh sách container"
-                }
-            
-            containers = result.stdout.strip().split("\n")
-            stopped_containers = []
-            errors = []
-            
-            for line in containers:
-                if not line.strip():
-                    continue
-                
-                parts = line.strip().split(maxsplit=1)
-                if len(parts) < 2:
-                    continue
-                    
-                container_id, container_name = parts
-                
-                if keyword.lower() in container_name.lower():
-                    stop_result = subprocess.run(
-                        ["docker", "stop", container_id],
-                        capture_output=True,
-                        text=True,
-                        timeout=30
-                    )
-                    
-                    if stop_result.returncode == 0:
-                        stopped_containers.append(container_name)
-                        logger.info(f"Stopped container: {container_name}")
-                    else:
-                        error_msg = f"❌ Lỗi khi dừng {container_name}: {stop_result.stderr.strip()}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
+            if self._docker is not None:
+                stopped_containers, errors = self._stop_with_sdk(keyword)
+            else:
+                stopped_containers, errors = self._stop_with_cli(keyword)
             
             if not stopped_containers and not errors:
                 return {
@@ -182,6 +260,107 @@ class ProcessService:
                 "message": f"❌ Lỗi hệ thống: {str(e)}"
             }
     
+    @staticmethod
+    def _name_filter(keyword: str) -> str:
+        """Build a case-insensitive docker name filter for keyword
+        
+        dockerd evaluates the name filter as a regular expression, so the
+        matching stays on the daemon side instead of lower-casing every
+        container name here.
+        
+        Args:
+            keyword: Partial container name to match
+            
+        Returns:
+            str: Filter value for --filter name=
+        """
+        return "(?i)" + re.escape(keyword)
+    
+    def _stop_with_sdk(self, keyword: str) -> Tuple[List[str], List[str]]:
+        """Stop matching containers through the Docker API, in parallel
+        
+        Args:
+            keyword: Partial container name to match
+            
+        Returns:
+            tuple: (stopped container names, error messages)
+        """
+        matches = self._docker.containers.list(filters={"name": self._name_filter(keyword)})
+        stopped_containers = []
+        errors = []
+        if not matches:
+            return stopped_containers, errors
+        
+        with ThreadPoolExecutor(max_workers=len(matches)) as pool:
+            futures = [(c.name, pool.submit(c.stop, timeout=10)) for c in matches]
+            for name, future in futures:
+                try:
+                    future.result()
+                    stopped_containers.append(name)
+                    logger.info(f"Stopped container: {name}")
+                except (docker.errors.DockerException, requests.RequestException) as e:
+                    # One unreachable container must not discard the others' results
+                    error_msg = f"❌ Lỗi khi dừng {name}: {getattr(e, 'explanation', None) or str(e)}"
+                    errors.append(error_msg)
+                    logger.error(error_msg)
+        
+        return stopped_containers, errors
+    
+    def _stop_with_cli(self, keyword: str) -> Tuple[List[str], List[str]]:
+        """Stop matching containers with one filtered ps and one docker stop
+        
+        Args:
+            keyword: Partial container name to match
+            
+        Returns:
+            tuple: (stopped container names, error messages)
+        """
+        # Let dockerd do the name matching and stop every match in one call
+        list_cmd = [
+            "docker", "ps",
+            "--filter", f"name={self._name_filter(keyword)}",
+            "--format", "{{.ID}}\t{{.Names}}"
+        ]
+        # stderr is never read, and only the short ID/name fields get decoded
+        result = subprocess.run(
+            list_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=30
+        )
+        
+        if result.returncode != 0:
+            return [], ["❌ Không thể lấy danh sách container"]
+        
+        names = {}
+        for line in result.stdout.splitlines():
+            container_id, sep, container_name = line.partition(b"\t")
+            if sep:
+                names[container_id.decode()] = container_name.decode()
+        stopped_containers = []
+        errors = []
+        
+        if names:
+            stop_result = subprocess.run(
+                ["docker", "stop", *names],
+                capture_output=True,
+                text=True,
+                timeout=max(30, 10 * len(names))
+            )
+        
+            for container_id in stop_result.stdout.split():
+                if container_id in names:
+                    stopped_containers.append(names[container_id])
+                    logger.info(f"Stopped container: {names[container_id]}")
+        
+            for line in stop_result.stderr.splitlines():
+                if line.strip():
+                    error_msg = f"❌ Lỗi khi dừng container: {line.strip()}"
+                    errors.append(error_msg)
+                    logger.error(error_msg)
+        
+        return stopped_containers, errors
+    
     def pull_docker_image(self, image_name: str) -> Dict[str, Any]:
         """Pull Docker image
         
@@ -192,22 +371,19 @@ class ProcessService:
             dict: Result with status and message
         """
         try:
-            cmd = ["docker", "pull", image_name]
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout
-            )
+            if self._docker is not None:
+                error = self._pull_with_sdk(image_name)
+            else:
+                error = self._pull_with_cli(image_name)
             
-            if process.returncode == 0:
+            if error is None:
                 logger.info(f"Successfully pulled image: {image_name}")
                 return {
                     "success": True,
                     "message": f"✅ Đã pull thành công image: {image_name}"
                 }
             else:
-                error_msg = f"❌ Lỗi khi pull image {image_name}: {process.stderr}"
+                error_msg = f"❌ Lỗi khi pull image {image_name}: {error}"
                 logger.error(error_msg)
                 return {
                     "success": False,
@@ -226,6 +402,32 @@ class ProcessService:
                 "message": f"❌ Lỗi hệ thống: {str(e)}"
             }
     
+    def _pull_with_sdk(self, image_name: str) -> Optional[str]:
+        """Pull an image through the Docker API, logging progress as it streams
+        
+        Returns:
+            str: Error reported by the daemon, or None on success
+        """
+        for event in self._docker.api.pull(image_name, stream=True, decode=True):
+            if "error" in event:
+                return event["error"]
+            logger.debug(f"{image_name}: {event.get('status', '')} {event.get('progress', '')}")
+        return None
+    
+    def _pull_with_cli(self, image_name: str) -> Optional[str]:
+        """Pull an image with the docker CLI
+        
+        Returns:
+            str: stderr of a failed pull, or None on success
+        """
+        process = subprocess.run(
+            ["docker", "pull", image_name],
+            capture_output=True,
+            text=True,
+            timeout=300  # 5 minutes timeout
+        )
+        return None if process.returncode == 0 else process.stderr
+    
     def stop_project(self, project: str) -> Dict[str, Any]:
         """Stop running project process
         
@@ -272,10 +474,14 @@ class ProcessService:
             if process.poll() is None:  # Process is still running
                 process.terminate()
                 try:
-                    process.wait(timeout=5)
+                    wait_for_exit(process, timeout=5)
                     logger.info(f"Process for {project} terminated gracefully")
                 except subprocess.TimeoutExpired:
                     process.kill()
+                    try:
+                        wait_for_exit(process, timeout=1)
+                    except subprocess.TimeoutExpired:
+                        logger.error(f"Process for {project} did not exit after SIGKILL")
                     logger.warning(f"Process for {project} was killed forcefully")
             
             del self._running_processes[project]
@@ -285,27 +491,23 @@ class ProcessService:
             logger.error(f"Error stopping process for {project}: {str(e)}")
             return False
     
-    def _monitor_process(self, project: str, process: subprocess.Popen):
-        """Monitor process completion
+    def _on_process_exit(self, project: str, process: subprocess.Popen, exit_code: int):
+        """Drop a finished project from the running set
         
         Args:
             project: Project name
-            process: Process object
+            process: Process object that exited
+            exit_code: Its exit status
         """
-        try:
-            exit_code = process.wait()
-            
-            with self._process_lock:
-                if project in self._running_processes:
-                    del self._running_processes[project]
-            
-            if exit_code == 0:
-                logger.info(f"Project {project} completed successfully")
-            else:
-                logger.warning(f"Project {project} completed with exit code: {exit_code}")
-                
-        except Exception as e:
-            logger.error(f"Error monitoring process for {project}: {str(e)}")
+        with self._process_lock:
+            # A stop or restart may already have replaced the entry
+            if self._running_processes.get(project) is process:
+                del self._running_processes[project]
+        
+        if exit_code == 0:
+            logger.info(f"Project {project} completed successfully")
+        else:
+            logger.warning(f"Project {project} completed with exit code: {exit_code}")
     
     def get_running_projects(self) -> list:
         """Get list of currently running projects
@@ -1,11 +1,15 @@
 import os
+import functools
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
-# Setup project path
-from utils.common import setup_project_path, setup_logging, handle_exceptions
-setup_project_path()
+from utils.common import setup_logging, handle_exceptions
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 from config.settings import Config
 from services.slack_service import SlackService
@@ -15,29 +19,41 @@ logger = setup_logging(__name__)
 class ReportService:
     """Service for handling test reports"""
     
-    def __init__(self):
-        self.project_config = {
-            "mlm": {
-                "display_name": "MLM AUTO",
-                "detail_url": f"{Config.DEFAULT_URL_REPORT}/mlm/",
-                "summary_url": f"{Config.DEFAULT_URL_REPORT}/mlm/serenity-summary.html"
-            },
-            "edpadmin": {
-                "display_name": "EDP Admin Project",
-                "detail_url": f"{Config.DEFAULT_URL_REPORT}/edpadmin/",
-                "summary_url": f"{Config.DEFAULT_URL_REPORT}/edpadmin/serenity-summary.html"
-            },
-            "edpdob": {
-                "display_name": "EDP DOB AUTO",
-                "detail_url": f"{Config.DEFAULT_URL_REPORT}/edpdob/",
-                "summary_url": f"{Config.DEFAULT_URL_REPORT}/edpdob/serenity-summary.html"
-            },
-            "vkyc": {
-                "display_name": "VKYC AUTO",
-                "detail_url": f"{Config.DEFAULT_URL_REPORT}/vkyc/",
-                "summary_url": f"{Config.DEFAULT_URL_REPORT}/vkyc/serenity-summary.html"
-            }
+    # Report URLs never change at runtime, so build them once at import
+    _PROJECT_CONFIG = {
+        "mlm": {
+            "display_name": "MLM AUTO",
+            "detail_url": f"{Config.DEFAULT_URL_REPORT}/mlm/",
+            "summary_url": f"{Config.DEFAULT_URL_REPORT}/mlm/serenity-summary.html"
+        },
+        "edpadmin": {
+            "display_name": "EDP Admin Project",
+            "detail_url": f"{Config.DEFAULT_URL_REPORT}/edpadmin/",
+            "summary_url": f"{Config.DEFAULT_URL_REPORT}/edpadmin/serenity-summary.html"
+        },
+        "edpdob": {
+            "display_name": "EDP DOB AUTO",
+            "detail_url": f"{Config.DEFAULT_URL_REPORT}/edpdob/",
+            "summary_url": f"{Config.DEFAULT_URL_REPORT}/edpdob/serenity-summary.html"
+        },
+        "vkyc": {
+            "display_name": "VKYC AUTO",
+            "detail_url": f"{Config.DEFAULT_URL_REPORT}/vkyc/",
+            "summary_url": f"{Config.DEFAULT_URL_REPORT}/vkyc/serenity-summary.html"
         }
+    }
+    
+    STAT_SELECTORS = {
+        "total": ('.total-tests', '[data-test="total"]', '.test-count-total'),
+        "passed": ('.passed-tests', '[data-test="passed"]', '.test-count-passed'),
+        "failed": ('.failed-tests', '[data-test="failed"]', '.test-count-failed'),
+        "error": ('.error-tests', '[data-test="error"]', '.test-count-error')
+    }
+    _DATE_SELECTOR = '.execution-date, .test-date, [data-test="execution-date"], time'
+    # One grouped query per statistic instead of one tree walk per selector
+    _STAT_SELECTORS_JOINED = {
+        stat_type: ", ".join(selectors) for stat_type, selectors in STAT_SELECTORS.items()
+    }
     
     @handle_exceptions(default_return={"success": False, "message": "❌ Lỗi không xác định khi tạo báo cáo"})
     def generate_report_message(self, project: str) -> Dict[str, Any]:
@@ -49,19 +65,19 @@ class ReportService:
         Returns:
             dict: Result with status and message
         """
-        if project not in Config.SUPPORTED_PROJECTS:
+        if project not in Config.SUPPORTED_PROJECTS_SET:
             return {
                 "success": False,
                 "message": f"❌ Project '{project}' không được hỗ trợ"
             }
         
-        if project not in self.project_config:
+        if project not in self._PROJECT_CONFIG:
             return {
                 "success": False,
                 "message": f"❌ Cấu hình báo cáo cho project '{project}' không tồn tại"
             }
         
-        config = self.project_config[project]
+        config = self._PROJECT_CONFIG[project]
         report_path = Config.REPORT_PATHS.get(project)
         
         if not report_path:
@@ -103,26 +119,19 @@ class ReportService:
             dict: Parsed report data or error
         """
         try:
-            if not os.path.exists(file_path):
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return {
                     "success": False,
                     "message": f"❌ File báo cáo không tồn tại: {file_path}"
                 }
             
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Extract execution date
-            execution_date = self._extract_execution_date(soup)
-            
-            # Extract test statistics
-            stats = self._extract_test_statistics(soup)
-            
+            # Reports only change when CI rewrites them, so reuse the last
+            # parse until the file's mtime or size moves
             return {
                 "success": True,
-                "data": (execution_date, stats["total"], stats["passed"], stats["failed"], stats["error"])
+                "data": self._parse_report_file(file_path, st.st_mtime_ns, st.st_size)
             }
             
         except Exception as e:
@@ -132,28 +141,85 @@ class ReportService:
                 "message": f"❌ Lỗi khi đọc file báo cáo: {str(e)}"
             }
     
-    def _extract_execution_date(self, soup: BeautifulSoup) -> str:
+    @functools.lru_cache(maxsize=32)
+    def _parse_report_file(self, file_path: str, mtime_ns: int, size: int) -> Tuple[str, int, int, int, int]:
+        """Parse a report file; cached on the file's identity
+        
+        Args:
+            file_path: Path to HTML report file
+            mtime_ns: Modification time of the file, part of the cache key
+            size: Size of the file, part of the cache key
+            
+        Returns:
+            tuple: (execution_date, total, passed, failed, error)
+        """
+        # Hand raw bytes to lxml; it sniffs the encoding itself
+        with open(file_path, 'rb') as file:
+            content = file.read()
+        
+        doc = self._load_document(content)
+        
+        # Extract execution date
+        execution_date = self._extract_execution_date(doc)
+        
+        # Extract test statistics
+        stats = self._extract_test_statistics(doc)
+        
+        return (execution_date, stats["total"], stats["passed"], stats["failed"], stats["error"])
+    
+    @staticmethod
+    def _load_document(content: bytes):
+        """Build a queryable document from raw report bytes
+        
+        selectolax keeps the tree in C and only materialises the nodes we
+        query, so it is preferred when installed; otherwise BeautifulSoup
+        with the lxml builder is used.
+        
+        Args:
+            content: Raw HTML bytes
+            
+        Returns:
+            selectolax HTMLParser or BeautifulSoup document
+        """
+        if HTMLParser is not None:
+            return HTMLParser(content)
+        return BeautifulSoup(content, 'lxml')
+    
+    @staticmethod
+    def _select(node, selector: str) -> list:
+        """Return all nodes under node matching a CSS selector"""
+        if HTMLParser is not None:
+            return node.css(selector)
+        return node.select(selector)
+    
+    @staticmethod
+    def _select_first(node, selector: str):
+        """Return the first node matching a CSS selector, or None"""
+        if HTMLParser is not None:
+            return node.css_first(selector)
+        return node.select_one(selector)
+    
+    @staticmethod
+    def _node_text(node) -> str:
+        """Return the stripped text content of a node"""
+        if HTMLParser is not None:
+            return node.text(strip=True)
+        return node.get_text(strip=True)
+    
+    def _extract_execution_date(self, doc) -> str:
         """Extract execution date from HTML
         
         Args:
-            soup: BeautifulSoup object
+            doc: Parsed report document
             
         Returns:
             str: Formatted execution date
         """
         try:
-            # Try multiple selectors for execution date
-            date_selectors = [
-                '.execution-date',
-                '.test-date',
-                '[data-test="execution-date"]',
-                'time'
-            ]
-            
-            for selector in date_selectors:
-                date_element = soup.select_one(selector)
-                if date_element:
-                    return date_element.get_text(strip=True)
+            # First match, in document order, of any known date selector
+            date_element = self._select_first(doc, self._DATE_SELECTOR)
+            if date_element is not None:
+                return self._node_text(date_element)
             
             # Fallback to current date if not found
             return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -161,11 +227,11 @@ class ReportService:
         except Exception:
             return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    def _extract_test_statistics(self, soup: BeautifulSoup) -> Dict[str, int]:
+    def _extract_test_statistics(self, doc) -> Dict[str, int]:
         """Extract test statistics from HTML
         
         Args:
-            soup: BeautifulSoup object
+            doc: Parsed report document
             
         Returns:
             dict: Test statistics
@@ -174,49 +240,40 @@ class ReportService:
         
         try:
             # Try to find statistics in common locations
-            stat_selectors = {
-                "total": ['.total-tests', '[data-test="total"]', '.test-count-total'],
-                "passed": ['.passed-tests', '[data-test="passed"]', '.test-count-passed'],
-                "failed": ['.failed-tests', '[data-test="failed"]', '.test-count-failed'],
-                "error": ['.error-tests', '[data-test="error"]', '.test-count-error']
-            }
-            
-            for stat_type, selectors in stat_selectors.items():
-                for selector in selectors:
-                    element = soup.select_one(selector)
-                    if element:
-                        try:
-                            stats[stat_type] = int(element.get_text(strip=True))
-                            break
-                        except ValueError:
-                            continue
+            for stat_type, selector in self._STAT_SELECTORS_JOINED.items():
+                for element in self._select(doc, selector):
+                    try:
+                        stats[stat_type] = int(self._node_text(element))
+                        break
+                    except ValueError:
+                        continue
             
             # If no specific selectors found, try to parse from summary tables
             if stats["total"] == 0:
-                self._parse_summary_table(soup, stats)
+                self._parse_summary_table(doc, stats)
             
         except Exception as e:
             logger.warning(f"Error extracting test statistics: {str(e)}")
         
         return stats
     
-    def _parse_summary_table(self, soup: BeautifulSoup, stats: Dict[str, int]):
+    def _parse_summary_table(self, doc, stats: Dict[str, int]):
         """Parse statistics from summary table
         
         Args:
-            soup: BeautifulSoup object
+            doc: Parsed report document
             stats: Statistics dictionary to update
         """
         try:
             # Look for summary tables
-            tables = soup.find_all('table')
+            tables = self._select(doc, 'table')[:3]
             for table in tables:
-                rows = table.find_all('tr')
+                rows = self._select(table, 'tr')
                 for row in rows:
-                    cells = row.find_all(['td', 'th'])
+                    cells = self._select(row, 'td, th')
                     if len(cells) >= 2:
-                        label = cells[0].get_text(strip=True).lower()
-                        value_text = cells[1].get_text(strip=True)
+                        label = self._node_text(cells[0]).lower()
+                        value_text = self._node_text(cells[1])
                         
                         try:
                             value = int(value_text)
@@ -286,4 +343,4 @@ class ReportService:
         Returns:
             list: List of project names
         """
-        return list(self.project_config.keys())
\ No newline at end of file
+        return list(self._PROJECT_CONFIG.keys())
\ No newline at end of file
@@ -1,21 +1,144 @@
+import atexit
+import functools
 import logging
-from slack_sdk import WebClient
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from slack_sdk.errors import SlackApiError
 
-# Setup project path
-from utils.common import setup_project_path, setup_logging, handle_exceptions
-setup_project_path()
+from utils.common import setup_logging, handle_exceptions
 
 from config.settings import Config
+from constants import SLACK_API_URL, SLACK_API_TIMEOUT, SLACK_COALESCE_WINDOW
 
 logger = setup_logging(__name__)
 
+# Keep-alive session for chat.postMessage shared by every SlackService, so
+# bursts of messages from any caller reuse one TLS connection instead of
+# handshaking per call. slack_sdk's sync WebClient sits on urllib and cannot
+# take a session, which is why sends go through requests directly.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+))
+_session.headers.update({"Authorization": f"Bearer {Config.SLACK_TOKEN}"})
+
+# Workers for urgent messages that skip the coalescing dispatcher but must
+# still not block the caller on Slack's round trip
+_slack_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slack")
+atexit.register(_slack_pool.shutdown, wait=True)
+
 class SlackService:
     """Service for Slack API interactions"""
     
     def __init__(self):
-        self.client = WebClient(token=Config.SLACK_TOKEN)
         self.channel = Config.SLACK_CHANNEL
+        self._session = _session
+        
+        # Fire-and-forget messages are drained in order by one dispatcher thread
+        self._queue = queue.SimpleQueue()
+        self._dispatcher = None
+        self._dispatcher_lock = threading.Lock()
+        # Flush queued messages at exit; a no-op unless the dispatcher runs
+        atexit.register(self.close)
+    
+    def send_message_async(self, message: str) -> None:
+        """Queue a message for delivery without waiting on Slack
+        
+        Messages are posted in the order they were queued; messages queued
+        within SLACK_COALESCE_WINDOW of each other go out as one post.
+        
+        Args:
+            message: Message content
+        """
+        if self._dispatcher is None:
+            with self._dispatcher_lock:
+                if self._dispatcher is None:
+                    self._dispatcher = threading.Thread(
+                        target=self._drain, name="slack-dispatcher", daemon=True
+                    )
+                    self._dispatcher.start()
+        self._queue.put(message)
+    
+    def send_message_now(self, message: str) -> Future:
+        """Post a message right away on a worker thread
+        
+        Unlike send_message_async the message is not held back for
+        coalescing; the caller still returns immediately.
+        
+        Args:
+            message: Message content
+            
+        Returns:
+            Future: Resolves to send_message's success flag
+        """
+        return _slack_pool.submit(self.send_message, message)
+    
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush queued messages and stop the dispatcher thread
+        
+        Args:
+            timeout: Seconds to wait for pending messages
+        """
+        if self._dispatcher is not None and self._dispatcher.is_alive():
+            self._queue.put(None)
+            self._dispatcher.join(timeout)
+        self._dispatcher = None
+    
+    def _drain(self) -> None:
+        """Dispatcher loop: post queued messages until the sentinel arrives
+        
+        Bursts are coalesced into a single newline-joined post so they cost
+        one chat.postMessage call instead of tripping Slack's rate limit.
+        """
+        while True:
+            message = self._queue.get()
+            if message is None:
+                return
+            batch = [message]
+            deadline = time.monotonic() + SLACK_COALESCE_WINDOW
+            stopping = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    message = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if message is None:
+                    stopping = True
+                    break
+                batch.append(message)
+            self.send_message("\n".join(batch))
+            if stopping:
+                return
+    
+    def _post_message(self, **payload) -> dict:
+        """Call chat.postMessage over the pooled session
+        
+        Args:
+            **payload: chat.postMessage arguments (channel is filled in)
+            
+        Returns:
+            dict: Slack API response body
+        """
+        payload.setdefault("channel", self.channel)
+        response = self._session.post(
+            SLACK_API_URL + "chat.postMessage",
+            json=payload,
+            timeout=SLACK_API_TIMEOUT
+        )
+        data = response.json()
+        if not data.get("ok"):
+            raise SlackApiError(f"Slack API error: {data.get('error')}", data)
+        return data
     
     @handle_exceptions(default_return=False)
     def send_message(self, message: str, ephemeral: bool = False) -> bool:
@@ -28,10 +151,7 @@ class SlackService:
         Returns:
             bool: Success status
         """
-        response = self.client.chat_postMessage(
-            channel=self.channel,
-            text=message
-        )
+        response = self._post_message(text=message)
         logger.info(f"Message sent successfully: {response['ts']}")
         return True
     
@@ -45,10 +165,7 @@ class SlackService:
             bool: Success status
         """
         try:
-            response = self.client.chat_postMessage(
-                channel=self.channel,
-                blocks=blocks
-            )
+            response = self._post_message(blocks=blocks)
             logger.info(f"Formatted message sent successfully: {response['ts']}")
             return True
             
@@ -58,4 +175,14 @@ class SlackService:
             
         except Exception as e:
             logger.error(f"Unexpected error sending formatted message: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_slack_service() -> SlackService:
+    """Return the process-wide SlackService
+    
+    Returns:
+        SlackService: Shared instance, created on first use
+    """
+    return SlackService()
@@ -3,15 +3,22 @@
 
 import os
 import sys
+import logging
+import pathlib
+import subprocess
 import pytest
+import requests
 import tempfile
 import shutil
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch
 from flask import Flask
 
 # Add project root to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from utils.common import ORJSONProvider
+
 # Test configuration
 TEST_CONFIG = {
     'TESTING': True,
@@ -34,8 +41,8 @@ TEST_CONFIG = {
 
 @pytest.fixture(scope='session')
 def test_config():
-    """Provide test configuration."""
-    return TEST_CONFIG.copy()
+    """Provide read-only test configuration; consumers never need to copy it."""
+    return MappingProxyType(TEST_CONFIG)
 
 
 @pytest.fixture(scope='session')
@@ -46,30 +53,51 @@ def temp_dir():
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='session')
 def mock_env_vars(test_config):
-    """Mock environment variables for testing."""
-    with patch.dict(os.environ, test_config, clear=False):
-        yield
+    """Set test environment variables once for the whole session.
+    
+    Only scalar settings are exported (environment values must be strings);
+    the original values are restored when the session ends.
+    """
+    test_env = {
+        key: str(value) for key, value in test_config.items()
+        if isinstance(value, (str, int))
+    }
+    original_env = {key: os.environ.get(key) for key in test_env}
+    os.environ.update(test_env)
+    yield
+    for key, value in original_env.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
 
 
 @pytest.fixture(scope='function')
-def flask_app(test_config, temp_dir):
-    """Create a Flask app instance for testing."""
-    # Update config with temp directory paths
-    config = test_config.copy()
-    config['REPORT_PATHS'] = {'test_project': os.path.join(temp_dir, 'reports')}
-    config['BATCH_PATHS'] = {'test_project': os.path.join(temp_dir, 'batch.bat')}
-    
-    # Create directories
-    os.makedirs(config['REPORT_PATHS']['test_project'], exist_ok=True)
-    
-    # Create test batch file
-    with open(config['BATCH_PATHS']['test_project'], 'w') as f:
-        f.write('@echo off\necho Test batch file\n')
-    
+def override_env(monkeypatch):
+    """Override environment variables for a single test."""
+    def _override(**values):
+        for key, value in values.items():
+            monkeypatch.setenv(key, str(value))
+    return _override
+
+
+@pytest.fixture(scope='function')
+def case_dir(temp_dir):
+    """Create a per-test directory inside the session temp directory."""
+    path = tempfile.mkdtemp(dir=temp_dir)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope='session')
+def _flask_app(test_config):
+    """Build the Flask test app once per session."""
     app = Flask(__name__)
-    app.config.update(config)
+    app.config.update(test_config)
+    # Same orjson-backed JSON as the real app, so get_json() parses in C
+    app.json = ORJSONProvider(app)
     
     # Add test routes
     @app.route('/health')
@@ -80,8 +108,26 @@ def flask_app(test_config, temp_dir):
     def test_route():
         return {'message': 'test'}, 200
     
-    with app.app_context():
-        yield app
+    return app
+
+
+@pytest.fixture(scope='function')
+def flask_app(_flask_app, case_dir):
+    """Provide the Flask app with paths pointing into this test's directory."""
+    report_paths = {'test_project': os.path.join(case_dir, 'reports')}
+    batch_paths = {'test_project': os.path.join(case_dir, 'batch.bat')}
+    
+    # Create directories
+    os.makedirs(report_paths['test_project'], exist_ok=True)
+    
+    # Create test batch file
+    with open(batch_paths['test_project'], 'w') as f:
+        f.write('@echo off\necho Test batch file\n')
+    
+    _flask_app.config.update(REPORT_PATHS=report_paths, BATCH_PATHS=batch_paths)
+    
+    with _flask_app.app_context():
+        yield _flask_app
 
 
 @pytest.fixture(scope='function')
@@ -90,112 +136,125 @@ def client(flask_app):
     return flask_app.test_client()
 
 
-@pytest.fixture(scope='function')
-def mock_slack_client():
-    """Mock Slack WebClient for testing."""
-    mock_client = Mock()
-    
-    # Mock successful responses
-    mock_client.chat_postMessage.return_value = {
+@pytest.fixture(scope='session')
+def _slack_post_template():
+    """Canned chat.postMessage response body, built once per session."""
+    return MappingProxyType({
         'ok': True,
+        'channel': 'C1234567890',
+        'ts': '1234567890.123456',
         'message': {
             'ts': '1234567890.123456',
             'text': 'Test message'
         }
-    }
-    
-    mock_client.conversations_list.return_value = {
-        'ok': True,
-        'channels': [
-            {
-                'id': 'C1234567890',
-                'name': 'general',
-                'is_member': True
-            }
-        ]
-    }
-    
-    mock_client.auth_test.return_value = {
-        'ok': True,
-        'user_id': 'U1234567890',
-        'team_id': 'T1234567890'
-    }
+    })
+
+
+@pytest.fixture(scope='session')
+def _build_slack_session(_slack_post_template):
+    """Return a factory for lightweight mock Slack sessions.
     
-    return mock_client
+    SlackService posts through services.slack_service._session, so the mock
+    only needs a post() whose response carries a chat.postMessage body. It is
+    a SimpleNamespace of plain Mocks, which is much cheaper to build than a
+    Mock specced against requests.Session.
+    """
+    def build():
+        response = Mock(spec=requests.Response, status_code=200)
+        response.json.return_value = dict(_slack_post_template)
+        # Named mocks keep assertion messages readable
+        return SimpleNamespace(post=Mock(name='post', return_value=response))
+    return build
+
+
+@pytest.fixture(scope='function')
+def mock_slack_session(_build_slack_session):
+    """Mock Slack HTTP session for testing."""
+    # A fresh session per test keeps call records and side effects isolated
+    return _build_slack_session()
 
 
 @pytest.fixture(scope='function')
-def mock_slack_service(mock_slack_client):
+def mock_slack_service(mock_slack_session):
     """Mock SlackService for testing."""
-    with patch('services.slack_service.WebClient', return_value=mock_slack_client):
+    with patch('services.slack_service._session', mock_slack_session):
         from services.slack_service import SlackService
         service = SlackService()
         yield service
 
 
-@pytest.fixture(scope='function')
-def mock_process_service():
-    """Mock ProcessService for testing."""
-    mock_service = Mock()
-    
-    # Mock successful process execution
-    mock_service.run_batch_file.return_value = {
-        'success': True,
-        'output': 'Process completed successfully',
-        'error': None,
-        'return_code': 0
-    }
-    
-    mock_service.stop_containers.return_value = {
-        'success': True,
-        'stopped_containers': ['container1', 'container2'],
-        'message': 'Containers stopped successfully'
+@pytest.fixture(scope='session')
+def _process_service_template():
+    """Canned ProcessService results, built once per session."""
+    return {
+        'run_batch_file.return_value': {
+            'success': True,
+            'output': 'Process completed successfully',
+            'error': None,
+            'return_code': 0
+        },
+        'stop_containers.return_value': {
+            'success': True,
+            'stopped_containers': ['container1', 'container2'],
+            'message': 'Containers stopped successfully'
+        }
     }
-    
-    return mock_service
 
 
 @pytest.fixture(scope='function')
-def mock_report_service(temp_dir):
-    """Mock ReportService for testing."""
-    mock_service = Mock()
-    
-    # Create test report file
+def mock_process_service(_process_service_template):
+    """Mock ProcessService for testing."""
+    return Mock(**_process_service_template)
+
+
+@pytest.fixture(scope='session')
+def _report_service_template(temp_dir):
+    """Test report file and canned ReportService results, built once per session."""
     report_path = os.path.join(temp_dir, 'test_report.txt')
     with open(report_path, 'w') as f:
         f.write('Test report content\nLine 2\nLine 3')
     
-    mock_service.read_report.return_value = {
-        'success': True,
-        'content': 'Test report content\nLine 2\nLine 3',
-        'file_path': report_path
+    return {
+        'read_report.return_value': {
+            'success': True,
+            'content': 'Test report content\nLine 2\nLine 3',
+            'file_path': report_path
+        },
+        'list_reports.return_value': {
+            'success': True,
+            'reports': ['test_report.txt'],
+            'count': 1
+        }
     }
-    
-    mock_service.list_reports.return_value = {
-        'success': True,
-        'reports': ['test_report.txt'],
-        'count': 1
+
+
+@pytest.fixture(scope='function')
+def mock_report_service(_report_service_template):
+    """Mock ReportService for testing."""
+    return Mock(**_report_service_template)
+
+
+@pytest.fixture(scope='session')
+def _docker_container_template():
+    """Canned Docker container attributes, built once per session."""
+    return {
+        'name': 'test_container',
+        'status': 'running',
+        'stop.return_value': None,
+        'remove.return_value': None
     }
-    
-    return mock_service
 
 
 @pytest.fixture(scope='function')
-def mock_docker_client():
+def mock_docker_client(_docker_container_template):
     """Mock Docker client for testing."""
-    mock_client = Mock()
-    
-    # Mock container operations
+    # 'name' is a Mock constructor argument, so set attributes via configure_mock
     mock_container = Mock()
-    mock_container.name = 'test_container'
-    mock_container.status = 'running'
-    mock_container.stop.return_value = None
-    mock_container.remove.return_value = None
-    
-    mock_client.containers.list.return_value = [mock_container]
-    mock_client.containers.get.return_value = mock_container
-    
-    return mock_client
+    mock_container.configure_mock(**_docker_container_template)
+    return Mock(**{
+        'containers.list.return_value': [mock_container],
+        'containers.get.return_value': mock_container
+    })
 
 
 @pytest.fixture(scope='function')
@@ -230,87 +289,116 @@ def sample_slack_command():
     }
 
 
+# Test file tree, one entry per top-level directory
+MOCK_FILES = {
+    'reports': ('test_report.txt', b'Test report content'),
+    'logs': ('app.log', b'Test log content'),
+    'batch': ('test.bat', b'@echo off\necho Test batch'),
+    'config': ('test.conf', b'test_setting=value'),
+}
+
+
+def _create_mock_dir(root, dir_name):
+    """Create one directory of the mock file tree and its test file."""
+    file_name, content = MOCK_FILES[dir_name]
+    path = pathlib.Path(root, dir_name)
+    path.mkdir(exist_ok=True)
+    path.joinpath(file_name).write_bytes(content)
+    return root
+
+
 @pytest.fixture(scope='function')
-def mock_file_system(temp_dir):
-    """Mock file system operations for testing."""
-    # Create test directory structure
-    test_dirs = [
-        'reports',
-        'logs',
-        'batch',
-        'config'
-    ]
-    
-    for dir_name in test_dirs:
-        os.makedirs(os.path.join(temp_dir, dir_name), exist_ok=True)
-    
-    # Create test files
-    test_files = {
-        'reports/test_report.txt': 'Test report content',
-        'logs/app.log': 'Test log content',
-        'batch/test.bat': '@echo off\necho Test batch',
-        'config/test.conf': 'test_setting=value'
-    }
-    
-    for file_path, content in test_files.items():
-        full_path = os.path.join(temp_dir, file_path)
-        with open(full_path, 'w') as f:
-            f.write(content)
+def mock_file_system_reports(temp_dir):
+    """Create only the reports part of the mock file system."""
+    return _create_mock_dir(temp_dir, 'reports')
+
+
+@pytest.fixture(scope='function')
+def mock_file_system_logs(temp_dir):
+    """Create only the logs part of the mock file system."""
+    return _create_mock_dir(temp_dir, 'logs')
+
+
+@pytest.fixture(scope='function')
+def mock_file_system_batch(temp_dir):
+    """Create only the batch part of the mock file system."""
+    return _create_mock_dir(temp_dir, 'batch')
+
+
+@pytest.fixture(scope='function')
+def mock_file_system_config(temp_dir):
+    """Create only the config part of the mock file system."""
+    return _create_mock_dir(temp_dir, 'config')
+
+
+@pytest.fixture(scope='function')
+def mock_file_system(request, temp_dir):
+    """Mock file system operations for testing.
     
+    Creates the whole tree; tests that need one area should request the
+    matching mock_file_system_<name> fixture instead.
+    """
+    for dir_name in MOCK_FILES:
+        request.getfixturevalue(f'mock_file_system_{dir_name}')
     return temp_dir
 
 
 @pytest.fixture(scope='function')
 def mock_logging():
     """Mock logging for testing."""
-    with patch('logging.getLogger') as mock_logger:
-        logger_instance = Mock()
-        mock_logger.return_value = logger_instance
+    logger_instance = Mock(spec_set=logging.Logger)
+    with patch('logging.getLogger', new=Mock(return_value=logger_instance)):
         yield logger_instance
 
 
+# Canned successful HTTP response for mock_requests
+_REQUESTS_RESPONSE_TEMPLATE = MappingProxyType({
+    'status_code': 200,
+    'json.return_value': {'ok': True},
+    'text': 'Success',
+})
+
+
 @pytest.fixture(scope='function')
 def mock_requests():
     """Mock requests library for testing."""
-    with patch('requests.post') as mock_post, \
-         patch('requests.get') as mock_get:
-        
-        # Mock successful responses
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'ok': True}
-        mock_response.text = 'Success'
-        
-        mock_post.return_value = mock_response
-        mock_get.return_value = mock_response
-        
+    # Fresh mocks per test so call records never leak between tests
+    mock_response = Mock(spec=requests.Response, **_REQUESTS_RESPONSE_TEMPLATE)
+    mock_post = Mock(return_value=mock_response)
+    mock_get = Mock(return_value=mock_response)
+    
+    # Plain attribute swaps are much cheaper than two patch start/stop pairs
+    original_post, original_get = requests.post, requests.get
+    requests.post, requests.get = mock_post, mock_get
+    try:
         yield {
             'post': mock_post,
             'get': mock_get,
             'response': mock_response
         }
+    finally:
+        requests.post, requests.get = original_post, original_get
 
 
 @pytest.fixture(scope='function')
 def mock_subprocess():
     """Mock subprocess operations for testing."""
-    with patch('subprocess.run') as mock_run, \
-         patch('subprocess.Popen') as mock_popen:
-        
-        # Mock successful subprocess execution
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = 'Process completed successfully'
-        mock_result.stderr = ''
-        
-        mock_run.return_value = mock_result
-        
-        # Mock Popen
-        mock_process = Mock()
-        mock_process.communicate.return_value = ('Success', '')
-        mock_process.returncode = 0
-        mock_popen.return_value = mock_process
-        
+    # Mock successful subprocess execution
+    mock_result = Mock(spec=subprocess.CompletedProcess)
+    mock_result.returncode = 0
+    mock_result.stdout = 'Process completed successfully'
+    mock_result.stderr = ''
+    
+    # Mock Popen
+    mock_process = Mock(spec=subprocess.Popen)
+    mock_process.communicate.return_value = ('Success', '')
+    mock_process.returncode = 0
+    
+    mock_run = Mock(return_value=mock_result)
+    mock_popen = Mock(return_value=mock_process)
+    
+    with patch('subprocess.run', new=mock_run), \
+         patch('subprocess.Popen', new=mock_popen):
         yield {
             'run': mock_run,
             'popen': mock_popen,
@@ -330,20 +418,14 @@ def setup_test_environment(mock_env_vars):
 @pytest.fixture(scope='function')
 def clean_imports():
     """Clean up imported modules after test."""
-    # Store original modules
-    original_modules = sys.modules.copy()
+    # Store original module names
+    original_modules = frozenset(sys.modules)
     
     yield
     
     # Remove any modules that were imported during the test
-    modules_to_remove = []
-    for module_name in sys.modules:
-        if module_name not in original_modules:
-            modules_to_remove.append(module_name)
-    
-    for module_name in modules_to_remove:
-        if module_name in sys.modules:
-            del sys.modules[module_name]
+    for module_name in sys.modules.keys() - original_modules:
+        sys.modules.pop(module_name, None)
 
 
 # Pytest configuration
@@ -370,16 +452,17 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on file location."""
     for item in items:
-        # Add markers based on test file location
-        if "unit" in str(item.fspath):
+        # Add markers based on test directory (exact path components)
+        parts = item.path.parts
+        if "unit" in parts:
             item.add_marker(pytest.mark.unit)
-        elif "integration" in str(item.fspath):
+        elif "integration" in parts:
             item.add_marker(pytest.mark.integration)
-        elif "e2e" in str(item.fspath):
+        elif "e2e" in parts:
             item.add_marker(pytest.mark.e2e)
         
         # Add slow marker for tests that might take longer
-        if "slow" in item.name or "performance" in str(item.fspath):
+        if "slow" in item.name or "performance" in parts:
             item.add_marker(pytest.mark.slow)
 
 
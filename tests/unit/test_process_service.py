@@ -0,0 +1,129 @@
+# test_process_service.py - Unit tests for ProcessService child reaping
+# Runs real short-lived children so the pidfd/epoll monitor and its fallback are exercised
+
+import pytest
+import subprocess
+import sys
+import threading
+from unittest.mock import patch
+
+from utils.common import wait_for_exit
+
+# Import the service to test
+try:
+    from services import process_service
+    from services.process_service import ProcessMonitor, ProcessService
+except ImportError:
+    # Fallback for testing without full project structure
+    process_service = None
+
+# Seconds to wait for a child's exit to be reported
+EXIT_TIMEOUT = 10
+
+
+def _python_child(code):
+    """Start a Python child running code"""
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+@pytest.fixture
+def exits():
+    """Record on_exit callbacks and signal when one arrives"""
+    received = []
+    event = threading.Event()
+    
+    def on_exit(name, process, exit_code):
+        received.append((name, process, exit_code))
+        event.set()
+    
+    return received, event, on_exit
+
+
+class TestProcessMonitor:
+    """Test cases for ProcessMonitor class."""
+    
+    @pytest.fixture(autouse=True)
+    def _require_service(self):
+        """Skip when the service module cannot be imported."""
+        if process_service is None:
+            pytest.skip("ProcessService not available")
+    
+    def test_on_exit_receives_exit_code(self, exits):
+        """Test that a finished child is reported with its exit code."""
+        # Arrange
+        received, event, on_exit = exits
+        monitor = ProcessMonitor()
+        process = _python_child("import sys; sys.exit(3)")
+        
+        # Act
+        monitor.register("mlm", process, on_exit)
+        
+        # Assert
+        assert event.wait(EXIT_TIMEOUT)
+        assert received == [("mlm", process, 3)]
+    
+    def test_falls_back_without_epoll(self, exits):
+        """Test the waiter-thread fallback when select.epoll is missing (as under gevent)."""
+        # Arrange
+        received, event, on_exit = exits
+        monitor = ProcessMonitor()
+        process = _python_child("import sys; sys.exit(4)")
+        
+        # Act
+        with patch.object(process_service, '_epoll_usable', return_value=False):
+            monitor.register("mlm", process, on_exit)
+        
+        # Assert
+        assert event.wait(EXIT_TIMEOUT)
+        assert received == [("mlm", process, 4)]
+        assert monitor._thread is None
+    
+    def test_run_batch_file_clears_finished_project(self, exits):
+        """Test that a project leaves the running set once its child exits."""
+        # Arrange
+        received, event, on_exit = exits
+        service = ProcessService()
+        original_on_exit = service._on_process_exit
+        
+        def record_exit(name, process, exit_code):
+            original_on_exit(name, process, exit_code)
+            on_exit(name, process, exit_code)
+        
+        service._on_process_exit = record_exit
+        child = [sys.executable, "-c", "pass"]
+        
+        # Act
+        with patch.dict(process_service.Config.BATCH_PATHS, {'mlm': 'run_mlm'}), \
+             patch.object(process_service, 'batch_command', return_value=child):
+            result = service.run_batch_file('mlm')
+        
+        # Assert
+        assert result['success'] is True
+        assert event.wait(EXIT_TIMEOUT)
+        assert received[0][0] == 'mlm'
+        assert received[0][2] == 0
+        assert service.get_running_projects() == []
+
+
+class TestWaitForExit:
+    """Test cases for wait_for_exit."""
+    
+    def test_returns_exit_code(self):
+        """Test that the exit code is returned once the child exits."""
+        process = _python_child("import sys; sys.exit(5)")
+        
+        assert wait_for_exit(process, timeout=EXIT_TIMEOUT) == 5
+    
+    def test_timeout_on_sleeping_child(self):
+        """Test that a child still running after the timeout raises TimeoutExpired."""
+        process = _python_child("import time; time.sleep(30)")
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                wait_for_exit(process, timeout=0.2)
+        finally:
+            process.kill()
+            process.wait()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,123 @@
+# test_report_reader.py - Unit tests for the summary report reader
+# Covers the streaming lxml scan used by gen_mess and read_summary_report_html
+
+import pytest
+
+# Import the module to test
+try:
+    from utils import report_reader
+except ImportError:
+    # Fallback for testing without full project structure
+    report_reader = None
+
+SUMMARY_HTML = """
+<html><body>
+<table><tr><td class="overview">
+<span>42 tests</span>
+<span>Run March 5 2025 at 14:30</span>
+</td></tr></table>
+<span class="badge success-badge">40</span>
+<span class="failure-badge">1</span>
+<span class="error-badge">n/a</span>
+</body></html>
+"""
+
+
+@pytest.fixture
+def write_report(tmp_path):
+    """Write report HTML to a file and return its path."""
+    if report_reader is None:
+        pytest.skip("report_reader not available")
+    
+    def _write(content, name='summary.html'):
+        path = tmp_path / name
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+    return _write
+
+
+class TestReadSummaryReport:
+    """Test cases for read_summary_report_html."""
+    
+    def test_reads_all_values(self, write_report):
+        """Test that date, total and badge counts are read from the report."""
+        # Act
+        result = report_reader.read_summary_report_html(write_report(SUMMARY_HTML))
+        
+        # Assert
+        assert result == ('2025-03-05 14:30:00', 42, 40, 1, 0)
+    
+    def test_empty_report(self, write_report):
+        """Test that an empty report yields defaults instead of raising."""
+        # Act
+        result = report_reader.read_summary_report_html(write_report('', 'empty.html'))
+        
+        # Assert
+        assert result == (None, None, 0, 0, 0)
+    
+    def test_rereads_after_report_changes(self, write_report):
+        """Test that the cache is keyed on the file, so a new run is picked up."""
+        # Arrange
+        path = write_report(SUMMARY_HTML)
+        report_reader.read_summary_report_html(path)
+        
+        # Act
+        write_report(SUMMARY_HTML.replace('42 tests', '7 tests'))
+        result = report_reader.read_summary_report_html(path)
+        
+        # Assert
+        assert result[1] == 7
+
+
+class TestHtmlWrappers:
+    """Test cases for the HTML-accepting extract_execution_date and get_total_tests."""
+    
+    @pytest.mark.parametrize("content", [SUMMARY_HTML, SUMMARY_HTML.encode('utf-8')])
+    def test_reads_str_and_bytes(self, content):
+        """Test that both wrappers accept report HTML as str or bytes."""
+        if report_reader is None:
+            pytest.skip("report_reader not available")
+        
+        assert report_reader.extract_execution_date(content) == '2025-03-05 14:30:00'
+        assert report_reader.get_total_tests(content) == 42
+    
+    def test_empty_html(self):
+        """Test that missing values come back as None."""
+        if report_reader is None:
+            pytest.skip("report_reader not available")
+        
+        assert report_reader.extract_execution_date('') is None
+        assert report_reader.get_total_tests(b'') is None
+
+
+class TestParseHelpers:
+    """Test cases for the overview text parsers."""
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("Run March 5 2025 at 14:30", "2025-03-05 14:30:00"),
+        ("Run 2025-03-05 14:30", "2025-03-05 14:30:00"),
+        ("Run Smarch 5 2025 at 14:30", None),
+        ("", None),
+    ])
+    def test_parse_execution_date(self, text, expected):
+        """Test overview date parsing, including the ISO fallback."""
+        if report_reader is None:
+            pytest.skip("report_reader not available")
+        
+        assert report_reader._parse_execution_date(text) == expected
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("42 tests", 42),
+        ("N/A", None),
+        ("", None),
+    ])
+    def test_parse_total(self, text, expected):
+        """Test reading the leading test count."""
+        if report_reader is None:
+            pytest.skip("report_reader not available")
+        
+        assert report_reader._parse_total(text) == expected
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -3,8 +3,13 @@
 
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
-from slack_sdk.errors import SlackApiError
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import call, patch
+
+from config.settings import Config
+from constants import SLACK_API_URL, SLACK_API_TIMEOUT, SLACK_COALESCE_WINDOW
 
 # Import the service to test
 try:
@@ -14,18 +19,52 @@ except ImportError:
     SlackService = None
 
 
+@pytest.fixture(scope="module")
+def _shared_slack_session(_build_slack_session):
+    """One mock Slack session shared by every test in this module."""
+    return _build_slack_session()
+
+
+@pytest.fixture(scope="module")
+def _shared_slack_service(_shared_slack_session):
+    """SlackService built once on the shared mock session, so no test reaches slack.com."""
+    if SlackService is None:
+        pytest.skip("SlackService not available")
+    
+    with patch('services.slack_service._session', _shared_slack_session):
+        yield SlackService()
+
+
+@pytest.fixture(scope="module")
+def send_pool():
+    """Thread pool reused by the concurrency tests."""
+    pool = ThreadPoolExecutor(max_workers=5, thread_name_prefix="send")
+    yield pool
+    pool.shutdown(wait=True)
+
+
 class TestSlackService:
     """Test cases for SlackService class."""
     
+    @pytest.fixture(autouse=True)
+    def _reset_slack_session(self, _shared_slack_session, _slack_post_template):
+        """Clear calls and side effects and restore the canned post response between tests."""
+        post = _shared_slack_session.post
+        response = post.return_value
+        post.reset_mock(side_effect=True)
+        response.json.reset_mock(return_value=True, side_effect=True)
+        response.status_code = 200
+        response.json.return_value = dict(_slack_post_template)
+    
     @pytest.fixture
-    def slack_service(self, mock_slack_client):
-        """Create SlackService instance with mocked client."""
-        if SlackService is None:
-            pytest.skip("SlackService not available")
-        
-        with patch('services.slack_service.WebClient', return_value=mock_slack_client):
-            service = SlackService()
-            return service
+    def mock_slack_session(self, _shared_slack_session):
+        """Mock Slack session shared across the module."""
+        return _shared_slack_session
+    
+    @pytest.fixture
+    def slack_service(self, _shared_slack_service):
+        """SlackService instance wired to the shared mock session."""
+        return _shared_slack_service
     
     @pytest.fixture
     def mock_config(self):
@@ -35,47 +74,66 @@ class TestSlackService:
             'SLACK_SIGNING_SECRET': 'test-signing-secret'
         }
     
-    def test_init_with_valid_token(self, mock_config):
+    def test_init_with_valid_token(self, mock_config, override_env):
         """Test SlackService initialization with valid token."""
         if SlackService is None:
             pytest.skip("SlackService not available")
         
-        with patch.dict(os.environ, mock_config):
-            with patch('services.slack_service.WebClient') as mock_client:
-                service = SlackService()
-                assert service is not None
-                mock_client.assert_called_once()
+        override_env(**mock_config)
+        with patch('services.slack_service._session') as mock_session:
+            service = SlackService()
+            assert service is not None
+            assert service._session is mock_session
     
     def test_init_without_token(self):
-        """Test SlackService initialization without token."""
+        """Test that startup validation rejects a missing Slack token."""
         if SlackService is None:
             pytest.skip("SlackService not available")
         
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises((ValueError, KeyError)):
-                SlackService()
+        with patch.object(Config, 'SLACK_TOKEN', None):
+            with pytest.raises(ValueError):
+                Config.validate()
+    
+    @pytest.mark.parametrize("message", [
+        "Test message",
+        "Test message with <special> &characters& and *formatting*",
+        "x" * 4000,  # Slack has a 4000 character limit
+        "Hello <@U1234567890>! How are you?",
+        "Please check <#C1234567890|random> channel",
+    ], ids=["simple", "special_characters", "large", "user_mention", "channel_mention"])
+    def test_send_message_variants(self, slack_service, mock_slack_session, message):
+        """Test message sending with plain, special, large and mention text."""
+        # Act
+        result = slack_service.send_message(message)
+        
+        # Assert
+        assert result is True
+        assert mock_slack_session.post.call_count == 1
+        assert mock_slack_session.post.call_args == call(
+            SLACK_API_URL + "chat.postMessage",
+            json={"text": message, "channel": slack_service.channel},
+            timeout=SLACK_API_TIMEOUT
+        )
     
-    def test_send_message_success(self, slack_service, mock_slack_client):
-        """Test successful message sending."""
+    def test_send_message_api_error(self, slack_service, mock_slack_session):
+        """Test message sending with API error."""
         # Arrange
-        channel = "#general"
         message = "Test message"
+        mock_slack_session.post.return_value.json.return_value = {
+            "ok": False,
+            "error": "channel_not_found"
+        }
         
         # Act
-        result = slack_service.send_message(channel, message)
+        result = slack_service.send_message(message)
         
         # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once_with(
-            channel=channel,
-            text=message
-        )
+        assert result is False
+        assert mock_slack_session.post.call_count == 1
     
-    def test_send_message_with_blocks(self, slack_service, mock_slack_client):
-        """Test sending message with blocks."""
+    def test_send_formatted_message(self, slack_service, mock_slack_session):
+        """Test sending formatted message with blocks."""
         # Arrange
-        channel = "#general"
-        message = "Test message"
         blocks = [
             {
                 "type": "section",
@@ -87,414 +145,157 @@ class TestSlackService:
         ]
         
         # Act
-        result = slack_service.send_message(channel, message, blocks=blocks)
+        result = slack_service.send_formatted_message(blocks)
         
         # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once_with(
-            channel=channel,
-            text=message,
-            blocks=blocks
+        assert result is True
+        assert mock_slack_session.post.call_count == 1
+        assert mock_slack_session.post.call_args == call(
+            SLACK_API_URL + "chat.postMessage",
+            json={"blocks": blocks, "channel": slack_service.channel},
+            timeout=SLACK_API_TIMEOUT
         )
     
-    def test_send_message_api_error(self, slack_service, mock_slack_client):
-        """Test message sending with API error."""
-        # Arrange
-        channel = "#general"
-        message = "Test message"
-        mock_slack_client.chat_postMessage.side_effect = SlackApiError(
-            message="channel_not_found",
-            response={"error": "channel_not_found"}
-        )
-        
-        # Act & Assert
-        with pytest.raises(SlackApiError):
-            slack_service.send_message(channel, message)
-    
-    def test_send_formatted_message(self, slack_service, mock_slack_client):
-        """Test sending formatted message."""
-        # Arrange
-        channel = "#general"
-        title = "Test Title"
-        message = "Test message"
-        color = "good"
-        
-        # Act
-        result = slack_service.send_formatted_message(channel, title, message, color)
-        
-        # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once()
-        call_args = mock_slack_client.chat_postMessage.call_args
-        assert call_args[1]['channel'] == channel
-        assert 'attachments' in call_args[1]
-    
-    def test_send_formatted_message_with_fields(self, slack_service, mock_slack_client):
-        """Test sending formatted message with fields."""
+    def test_send_formatted_message_api_error(self, slack_service, mock_slack_session):
+        """Test formatted message sending with API error."""
         # Arrange
-        channel = "#general"
-        title = "Test Title"
-        message = "Test message"
-        fields = [
-            {"title": "Field 1", "value": "Value 1", "short": True},
-            {"title": "Field 2", "value": "Value 2", "short": False}
-        ]
-        
-        # Act
-        result = slack_service.send_formatted_message(
-            channel, title, message, fields=fields
-        )
-        
-        # Assert
-        assert result is not None
-        call_args = mock_slack_client.chat_postMessage.call_args
-        attachments = call_args[1]['attachments']
-        assert len(attachments) > 0
-        assert 'fields' in attachments[0]
-        assert len(attachments[0]['fields']) == 2
-    
-    def test_get_channel_info(self, slack_service, mock_slack_client):
-        """Test getting channel information."""
-        # Arrange
-        channel_id = "C1234567890"
-        mock_slack_client.conversations_info.return_value = {
-            'ok': True,
-            'channel': {
-                'id': channel_id,
-                'name': 'general',
-                'is_member': True
-            }
-        }
-        
-        # Act
-        result = slack_service.get_channel_info(channel_id)
-        
-        # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.conversations_info.assert_called_once_with(channel=channel_id)
-    
-    def test_list_channels(self, slack_service, mock_slack_client):
-        """Test listing channels."""
-        # Arrange
-        mock_slack_client.conversations_list.return_value = {
-            'ok': True,
-            'channels': [
-                {'id': 'C1234567890', 'name': 'general'},
-                {'id': 'C0987654321', 'name': 'random'}
-            ]
-        }
-        
-        # Act
-        result = slack_service.list_channels()
-        
-        # Assert
-        assert result is not None
-        assert result['ok'] is True
-        assert len(result['channels']) == 2
-        mock_slack_client.conversations_list.assert_called_once()
-    
-    def test_validate_token(self, slack_service, mock_slack_client):
-        """Test token validation."""
-        # Arrange
-        mock_slack_client.auth_test.return_value = {
-            'ok': True,
-            'user_id': 'U1234567890',
-            'team_id': 'T1234567890'
-        }
-        
-        # Act
-        result = slack_service.validate_token()
-        
-        # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.auth_test.assert_called_once()
-    
-    def test_validate_token_invalid(self, slack_service, mock_slack_client):
-        """Test token validation with invalid token."""
-        # Arrange
-        mock_slack_client.auth_test.side_effect = SlackApiError(
-            message="invalid_auth",
-            response={"error": "invalid_auth"}
-        )
-        
-        # Act & Assert
-        with pytest.raises(SlackApiError):
-            slack_service.validate_token()
-    
-    def test_upload_file(self, slack_service, mock_slack_client):
-        """Test file upload."""
-        # Arrange
-        channel = "#general"
-        file_path = "/tmp/test.txt"
-        filename = "test.txt"
-        title = "Test File"
-        
-        mock_slack_client.files_upload.return_value = {
-            'ok': True,
-            'file': {
-                'id': 'F1234567890',
-                'name': filename
-            }
+        mock_slack_session.post.return_value.json.return_value = {
+            "ok": False,
+            "error": "invalid_blocks"
         }
         
         # Act
-        result = slack_service.upload_file(channel, file_path, filename, title)
+        result = slack_service.send_formatted_message([{"type": "divider"}])
         
         # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.files_upload.assert_called_once()
+        assert result is False
+        assert mock_slack_session.post.call_count == 1
     
-    def test_delete_message(self, slack_service, mock_slack_client):
-        """Test message deletion."""
-        # Arrange
-        channel = "#general"
-        timestamp = "1234567890.123456"
-        
-        mock_slack_client.chat_delete.return_value = {
-            'ok': True,
-            'ts': timestamp
-        }
-        
-        # Act
-        result = slack_service.delete_message(channel, timestamp)
-        
-        # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.chat_delete.assert_called_once_with(
-            channel=channel,
-            ts=timestamp
-        )
-    
-    def test_update_message(self, slack_service, mock_slack_client):
-        """Test message update."""
+    def test_error_handling_network_error(self, slack_service, mock_slack_session):
+        """Test error handling for network errors."""
         # Arrange
-        channel = "#general"
-        timestamp = "1234567890.123456"
-        new_text = "Updated message"
-        
-        mock_slack_client.chat_update.return_value = {
-            'ok': True,
-            'ts': timestamp,
-            'text': new_text
-        }
+        message = "Test message"
+        mock_slack_session.post.side_effect = requests.ConnectionError("Network error")
         
         # Act
-        result = slack_service.update_message(channel, timestamp, new_text)
+        result = slack_service.send_message(message)
         
         # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.chat_update.assert_called_once_with(
-            channel=channel,
-            ts=timestamp,
-            text=new_text
-        )
+        assert result is False
+        assert mock_slack_session.post.call_count == 1
     
-    def test_add_reaction(self, slack_service, mock_slack_client):
-        """Test adding reaction to message."""
+    def test_rate_limiting_handling(self, slack_service, mock_slack_session):
+        """Test rate limiting handling."""
         # Arrange
-        channel = "#general"
-        timestamp = "1234567890.123456"
-        emoji = "thumbsup"
-        
-        mock_slack_client.reactions_add.return_value = {
-            'ok': True
-        }
-        
-        # Act
-        result = slack_service.add_reaction(channel, timestamp, emoji)
+        message = "Test message"
         
-        # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.reactions_add.assert_called_once_with(
-            channel=channel,
-            timestamp=timestamp,
-            name=emoji
-        )
-    
-    def test_get_user_info(self, slack_service, mock_slack_client):
-        """Test getting user information."""
-        # Arrange
-        user_id = "U1234567890"
-        mock_slack_client.users_info.return_value = {
-            'ok': True,
-            'user': {
-                'id': user_id,
-                'name': 'testuser',
-                'real_name': 'Test User'
-            }
-        }
+        # Simulate rate limiting error
+        response = mock_slack_session.post.return_value
+        response.status_code = 429
+        response.json.return_value = {"ok": False, "error": "ratelimited"}
         
         # Act
-        result = slack_service.get_user_info(user_id)
+        result = slack_service.send_message(message)
         
         # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.users_info.assert_called_once_with(user=user_id)
+        assert result is False
+        assert mock_slack_session.post.call_count == 1
     
-    def test_send_ephemeral_message(self, slack_service, mock_slack_client):
-        """Test sending ephemeral message."""
+    def test_concurrent_message_sending(self, slack_service, mock_slack_session, send_pool):
+        """Test concurrent message sending."""
         # Arrange
-        channel = "#general"
-        user = "U1234567890"
-        message = "Ephemeral message"
-        
-        mock_slack_client.chat_postEphemeral.return_value = {
-            'ok': True,
-            'message_ts': '1234567890.123456'
-        }
+        messages = [f"Message {i}" for i in range(5)]
         
         # Act
-        result = slack_service.send_ephemeral_message(channel, user, message)
+        results = list(send_pool.map(slack_service.send_message, messages))
         
         # Assert
-        assert result is not None
-        assert result['ok'] is True
-        mock_slack_client.chat_postEphemeral.assert_called_once_with(
-            channel=channel,
-            user=user,
-            text=message
-        )
-    
-    @pytest.mark.parametrize("channel,expected", [
-        ("#general", "#general"),
-        ("general", "#general"),
-        ("C1234567890", "C1234567890"),
-        ("@user", "@user")
-    ])
-    def test_format_channel(self, slack_service, channel, expected):
-        """Test channel formatting."""
-        # Act
-        result = slack_service._format_channel(channel)
-        
-        # Assert
-        assert result == expected
+        assert results == [True] * 5
+        assert mock_slack_session.post.call_count == 5
+        sent = sorted(args.kwargs["json"]["text"] for args in mock_slack_session.post.call_args_list)
+        assert sent == messages
+
+
+class TestSlackServiceDispatch:
+    """Test cases for the queued and immediate send paths."""
     
-    def test_error_handling_network_error(self, slack_service, mock_slack_client):
-        """Test error handling for network errors."""
-        # Arrange
-        channel = "#general"
-        message = "Test message"
-        mock_slack_client.chat_postMessage.side_effect = Exception("Network error")
+    @pytest.fixture
+    def dispatch_service(self, _build_slack_session):
+        """Fresh SlackService per test, since close() stops its dispatcher."""
+        if SlackService is None:
+            pytest.skip("SlackService not available")
         
-        # Act & Assert
-        with pytest.raises(Exception):
-            slack_service.send_message(channel, message)
+        session = _build_slack_session()
+        with patch('services.slack_service._session', session):
+            service = SlackService()
+        yield service, session
+        service.close()
     
-    def test_rate_limiting_handling(self, slack_service, mock_slack_client):
-        """Test rate limiting handling."""
-        # Arrange
-        channel = "#general"
-        message = "Test message"
-        
-        # Simulate rate limiting error
-        rate_limit_error = SlackApiError(
-            message="rate_limited",
-            response={
-                "error": "rate_limited",
-                "headers": {"Retry-After": "30"}
-            }
-        )
-        mock_slack_client.chat_postMessage.side_effect = rate_limit_error
-        
-        # Act & Assert
-        with pytest.raises(SlackApiError):
-            slack_service.send_message(channel, message)
+    @staticmethod
+    def _sent_texts(session):
+        """Texts of every chat.postMessage made through the mock session"""
+        return [args.kwargs["json"]["text"] for args in session.post.call_args_list]
     
-    def test_message_formatting_special_characters(self, slack_service, mock_slack_client):
-        """Test message formatting with special characters."""
+    def test_messages_within_window_are_coalesced(self, dispatch_service):
+        """Test that a burst of queued messages goes out as one post, in order."""
         # Arrange
-        channel = "#general"
-        message = "Test message with <special> &characters& and *formatting*"
+        service, session = dispatch_service
+        posted = threading.Event()
+        response = session.post.return_value
+        session.post.side_effect = lambda *args, **kwargs: posted.set() or response
+        messages = ["first", "second", "third"]
         
         # Act
-        result = slack_service.send_message(channel, message)
+        for message in messages:
+            service.send_message_async(message)
         
         # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once_with(
-            channel=channel,
-            text=message
-        )
+        assert posted.wait(SLACK_COALESCE_WINDOW + 5)
+        assert session.post.call_count == 1
+        assert self._sent_texts(session) == ["first\nsecond\nthird"]
     
-    def test_large_message_handling(self, slack_service, mock_slack_client):
-        """Test handling of large messages."""
+    def test_close_flushes_pending_messages(self, dispatch_service):
+        """Test that close() posts queued messages before returning."""
         # Arrange
-        channel = "#general"
-        large_message = "x" * 4000  # Slack has a 4000 character limit
+        service, session = dispatch_service
         
         # Act
-        result = slack_service.send_message(channel, large_message)
+        service.send_message_async("pending 1")
+        service.send_message_async("pending 2")
+        service.close()
         
         # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once()
+        assert self._sent_texts(session) == ["pending 1\npending 2"]
     
-    def test_concurrent_message_sending(self, slack_service, mock_slack_client):
-        """Test concurrent message sending."""
-        import threading
-        import time
-        
+    def test_send_message_now(self, dispatch_service):
+        """Test that send_message_now posts on a worker without coalescing."""
         # Arrange
-        channel = "#general"
-        messages = [f"Message {i}" for i in range(5)]
-        results = []
-        
-        def send_message(msg):
-            result = slack_service.send_message(channel, msg)
-            results.append(result)
+        service, session = dispatch_service
         
         # Act
-        threads = []
-        for message in messages:
-            thread = threading.Thread(target=send_message, args=(message,))
-            threads.append(thread)
-            thread.start()
-        
-        for thread in threads:
-            thread.join()
+        result = service.send_message_now("urgent").result(timeout=5)
         
         # Assert
-        assert len(results) == 5
-        assert mock_slack_client.chat_postMessage.call_count == 5
+        assert result is True
+        assert self._sent_texts(session) == ["urgent"]
     
-    def test_message_with_mentions(self, slack_service, mock_slack_client):
-        """Test sending message with user mentions."""
-        # Arrange
-        channel = "#general"
-        message = "Hello <@U1234567890>! How are you?"
-        
-        # Act
-        result = slack_service.send_message(channel, message)
+    def test_exit_hook_registered_once(self, _build_slack_session):
+        """Test that restarting the dispatcher does not register close() again."""
+        if SlackService is None:
+            pytest.skip("SlackService not available")
         
-        # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once_with(
-            channel=channel,
-            text=message
-        )
-    
-    def test_message_with_channel_mentions(self, slack_service, mock_slack_client):
-        """Test sending message with channel mentions."""
         # Arrange
-        channel = "#general"
-        message = "Please check <#C1234567890|random> channel"
-        
-        # Act
-        result = slack_service.send_message(channel, message)
+        with patch('services.slack_service._session', _build_slack_session()), \
+             patch('services.slack_service.atexit.register') as register:
+            service = SlackService()
+            
+            # Act
+            for _ in range(2):
+                service.send_message_async("message")
+                service.close()
         
         # Assert
-        assert result is not None
-        mock_slack_client.chat_postMessage.assert_called_once_with(
-            channel=channel,
-            text=message
-        )
+        assert register.call_args_list == [call(service.close)]
 
 
 class TestSlackServiceIntegration:
@@ -513,16 +314,16 @@ class TestSlackServiceIntegration:
         pass
     
     @pytest.mark.integration
-    def test_slack_service_with_real_config(self, test_config):
+    def test_slack_service_with_real_config(self, test_config, override_env):
         """Test SlackService with realistic configuration."""
         if SlackService is None:
             pytest.skip("SlackService not available")
         
-        with patch.dict(os.environ, test_config):
-            with patch('services.slack_service.WebClient') as mock_client:
-                service = SlackService()
-                assert service is not None
-                mock_client.assert_called_once()
+        override_env(**test_config)
+        with patch('services.slack_service._session') as mock_session:
+            service = SlackService()
+            assert service is not None
+            assert service._session is mock_session
 
 
 if __name__ == '__main__':
@@ -2,11 +2,24 @@
 
 import os
 import sys
+import queue
+import atexit
+import select
+import time
 import logging
+import threading
+import subprocess
 import functools
-from typing import Any, Callable, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, List, Optional, Union
 from datetime import datetime
-from constants import LOGS_DIR, DEFAULT_LOG_FORMAT
+from urllib.parse import parse_qsl
+import orjson
+from flask import Response, Request, g
+from flask.json.provider import DefaultJSONProvider
+from constants import LOGS_DIR, DEFAULT_LOG_FORMAT, SUPPORTED_PROJECTS, SUPPORTED_PROJECTS_SET
+
+_SUPPORTED_PROJECTS_TEXT = ', '.join(SUPPORTED_PROJECTS)
 
 
 def setup_project_path():
@@ -16,9 +29,67 @@ def setup_project_path():
         sys.path.insert(0, project_root)
 
 
+# Loggers only enqueue records; one listener thread per destination does the
+# blocking console/file writes. Keyed by log file (None = console only).
+_log_queue_handlers: Dict[Optional[str], QueueHandler] = {}
+_log_listeners: List[QueueListener] = []
+_log_handlers_lock = threading.Lock()
+_log_formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
+_logs_dir_ready = False
+
+
+def _get_queue_handler(log_file: Optional[str]) -> QueueHandler:
+    """Return the shared queue handler for a destination, starting its listener
+    
+    Args:
+        log_file: Optional log file name under LOGS_DIR
+        
+    Returns:
+        QueueHandler feeding that destination's listener
+    """
+    global _logs_dir_ready
+    
+    with _log_handlers_lock:
+        queue_handler = _log_queue_handlers.get(log_file)
+        if queue_handler is None:
+            handlers = [logging.StreamHandler()]
+            if log_file:
+                if not _logs_dir_ready:
+                    os.makedirs(LOGS_DIR, exist_ok=True)
+                    _logs_dir_ready = True
+                handlers.append(logging.FileHandler(os.path.join(LOGS_DIR, log_file)))
+            for handler in handlers:
+                handler.setFormatter(_log_formatter)
+            
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers)
+            listener.start()
+            _log_listeners.append(listener)
+            queue_handler = _log_queue_handlers[log_file] = QueueHandler(log_queue)
+        return queue_handler
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the listener threads
+    
+    Registered with atexit; call it directly when shutting down without
+    going through interpreter exit.
+    """
+    with _log_handlers_lock:
+        while _log_listeners:
+            _log_listeners.pop().stop()
+        _log_queue_handlers.clear()
+
+
+atexit.register(stop_logging)
+
+
 def setup_logging(name: str, level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """Setup standardized logging configuration
     
+    Records are handed to a QueueHandler, so logging never blocks the caller
+    on console or file I/O; a background QueueListener writes them out.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -34,66 +105,67 @@ def setup_logging(name: str, level: str = "INFO", log_file: Optional[str] = None
         return logger
         
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Create formatter
-    formatter = logging.Formatter(DEFAULT_LOG_FORMAT)
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler if specified
-    if log_file:
-        os.makedirs(LOGS_DIR, exist_ok=True)
-        file_handler = logging.FileHandler(os.path.join(LOGS_DIR, log_file))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    logger.addHandler(_get_queue_handler(log_file))
     
     return logger
 
 
 def log_execution_time(func: Callable) -> Callable:
     """Decorator to log function execution time"""
+    # Resolved once per decorated function rather than on every call
+    logger = logging.getLogger(func.__module__)
+    name = func.__name__
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = datetime.now()
-        logger = logging.getLogger(func.__module__)
+        start_ns = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.info(f"{func.__name__} executed in {execution_time:.2f}s")
+            # Skip building the message when INFO is filtered out
+            if logger.isEnabledFor(logging.INFO):
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                logger.info(f"{name} executed in {execution_time:.2f}s")
             return result
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.error(f"{func.__name__} failed after {execution_time:.2f}s: {str(e)}")
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.error(f"{name} failed after {execution_time:.2f}s: {str(e)}")
             raise
     
     return wrapper
 
 
-def handle_exceptions(default_return: Any = None, log_error: bool = True) -> Callable:
+def handle_exceptions(default_return: Any = None, log_error: bool = True,
+                      default_factory: Optional[Callable[[], Any]] = None) -> Callable:
     """Decorator to handle exceptions gracefully
     
     Args:
         default_return: Value to return on exception
         log_error: Whether to log the error
+        default_factory: Called to build a fresh return value on each
+            exception; takes precedence over default_return
     """
     def decorator(func: Callable) -> Callable:
+        # Resolved once per decorated function rather than on every call
+        logger = logging.getLogger(func.__module__)
+        name = func.__name__
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                if log_error:
-                    logger = logging.getLogger(func.__module__)
-                    logger.error(f"Error in {func.__name__}: {str(e)}")
+                # Lazy %-formatting: the message is only built if ERROR is enabled
+                if log_error and logger.isEnabledFor(logging.ERROR):
+                    logger.error("Error in %s: %s", name, e)
+                if default_factory is not None:
+                    return default_factory()
                 return default_return
         return wrapper
     return decorator
 
 
+@functools.lru_cache(maxsize=64)
 def validate_project_name(project: str) -> tuple[bool, str]:
     """Validate project name against supported projects
     
@@ -103,19 +175,33 @@ def validate_project_name(project: str) -> tuple[bool, str]:
     Returns:
         tuple: (is_valid, error_message)
     """
-    from constants import SUPPORTED_PROJECTS
-    
     if not project:
         return False, "Project name cannot be empty"
     
     project = project.strip().lower()
     
-    if project not in SUPPORTED_PROJECTS:
-        return False, f"Project '{project}' not supported. Supported: {', '.join(SUPPORTED_PROJECTS)}"
+    if project not in SUPPORTED_PROJECTS_SET:
+        return False, f"Project '{project}' not supported. Supported: {_SUPPORTED_PROJECTS_TEXT}"
     
     return True, ""
 
 
+# (epoch second, ISO timestamp) for the most recent response; replaced as a
+# whole tuple so concurrent readers never see a mismatched pair
+_timestamp_cache = (0, "")
+
+
+def _current_timestamp() -> str:
+    """Return the current local time as an ISO string, formatted once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if cached_second != now:
+        cached_text = datetime.fromtimestamp(now).isoformat()
+        _timestamp_cache = (now, cached_text)
+    return cached_text
+
+
 def create_response_dict(success: bool, message: str, data: Optional[Dict] = None) -> Dict[str, Any]:
     """Create standardized response dictionary
     
@@ -130,7 +216,7 @@ def create_response_dict(success: bool, message: str, data: Optional[Dict] = Non
     response = {
         "success": success,
         "message": message,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _current_timestamp()
     }
     
     if data:
@@ -139,6 +225,76 @@ def create_response_dict(success: bool, message: str, data: Optional[Dict] = Non
     return response
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify() encodes in C"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+def encode_ephemeral(text: str) -> bytes:
+    """Encode an ephemeral Slack reply body
+    
+    Args:
+        text: Message shown only to the user who issued the command
+        
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps({"response_type": "ephemeral", "text": text})
+
+
+def json_bytes_response(body: bytes, status: int = 200) -> Response:
+    """Wrap an already-encoded JSON body in a fresh Flask response
+    
+    Args:
+        body: JSON payload bytes
+        status: HTTP status code
+        
+    Returns:
+        Flask response
+    """
+    return Response(body, status=status, content_type="application/json")
+
+
+def ephemeral_response(text: str) -> Response:
+    """Build an ephemeral Slack response with an orjson-encoded body
+    
+    Args:
+        text: Message shown only to the user who issued the command
+        
+    Returns:
+        Flask response with status 200
+    """
+    return json_bytes_response(encode_ephemeral(text))
+
+
+def get_slash_field(req: Request, field: str = "text", lower: bool = True) -> str:
+    """Read a field from a Slack slash-command payload
+    
+    Slack posts plain application/x-www-form-urlencoded bodies, so the body
+    is parsed once with parse_qsl and cached on flask.g for the request.
+    
+    Args:
+        req: Current Flask request
+        field: Form field name
+        lower: Whether to lower-case the value
+        
+    Returns:
+        Stripped field value, empty string if missing
+    """
+    form = g.get("slack_form")
+    if form is None:
+        form = dict(parse_qsl(req.get_data(as_text=True), keep_blank_values=True))
+        g.slack_form = form
+    
+    value = form.get(field, "").strip()
+    return value.lower() if lower else value
+
+
 def safe_get_env(key: str, default: str = "", required: bool = False) -> str:
     """Safely get environment variable with validation
     
@@ -158,4 +314,59 @@ def safe_get_env(key: str, default: str = "", required: bool = False) -> str:
     if required and not value:
         raise ValueError(f"Required environment variable '{key}' is missing")
     
-    return value
\ No newline at end of file
+    return value
+
+
+def wait_for_exit(process: subprocess.Popen, timeout: float) -> int:
+    """Wait for a child process to exit without a sleep/poll loop
+    
+    On Linux the wait blocks on a pidfd until the kernel reports the exit;
+    elsewhere Popen.wait() is used (on Windows it already blocks on the
+    process handle).
+    
+    Args:
+        process: Child process to wait for
+        timeout: Maximum seconds to wait
+        
+    Returns:
+        Process exit code
+        
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None or process.returncode is not None:
+        return process.wait(timeout)
+    
+    try:
+        pidfd = pidfd_open(process.pid)
+    except OSError:
+        # Already reaped, or the kernel predates pidfd (Linux < 5.3)
+        return process.wait(timeout)
+    
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            raise subprocess.TimeoutExpired(process.args, timeout)
+    finally:
+        os.close(pidfd)
+    
+    return process.wait()
+
+
+def batch_command(path: str) -> list:
+    """Build the argv that runs a batch/script file without a shell
+    
+    .bat/.cmd files are handed to cmd.exe on Windows; anywhere else the
+    script is executed directly and must carry its own shebang.
+    
+    Args:
+        path: Path to the batch or script file
+        
+    Returns:
+        list: Argument vector for subprocess
+    """
+    if sys.platform == "win32":
+        return ["cmd.exe", "/c", path]
+    return [path]
@@ -1,13 +1,27 @@
-# Setup project path
-from utils.common import setup_project_path, setup_logging, handle_exceptions
-setup_project_path()
-
-from bs4 import BeautifulSoup
+import io
+import os
+import re
+import functools
 from datetime import datetime
+from typing import Optional
 from config.settings import Config
+from utils.common import setup_logging, handle_exceptions
 
 logger = setup_logging(__name__)
 
+# Overview date, e.g. "March 5 2025 at 14:30"
+_DATE_RE = re.compile(r"([A-Za-z]+) (\d{1,2}) (\d{4}) at (\d{1,2}):(\d{2})")
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"),
+        start=1
+    )
+}
+
+# Status badges counted in the summary
+_BADGE_CLASSES = ("success-badge", "failure-badge", "error-badge")
+
 PROJECT_CONFIG = {
     "mlm": {
         "file_path": Config.REPORT_PATHS.get("mlm", ""),
@@ -27,6 +41,11 @@ PROJECT_CONFIG = {
     }
 }
 
+# Slack-formatted report links never change, so build them once
+for _config in PROJECT_CONFIG.values():
+    _config["shortened_link"] = f"<{_config['report_link']}|Xem báo cáo>"
+del _config
+
 @handle_exceptions(default_return="❌ Lỗi không xác định khi tạo báo cáo")
 def gen_mess(project):
     """Generate report message for a project
@@ -46,47 +65,58 @@ def gen_mess(project):
     if not file_path:
         return f"❌ Đường dẫn báo cáo cho project '{project}' chưa được cấu hình"
     
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # Extract report data
-        execution_date = extract_execution_date(soup)
-        total, passed, failed, error = extract_test_results(soup)
+    # Reports change only when a run finishes, so reuse the message until
+    # the file's mtime or size moves
+    stat = os.stat(file_path)
+    return _build_report_message(project, stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=16)
+def _build_report_message(project, mtime_ns, size):
+    """Read a project's report and format its message
+    
+    Args:
+        project: Project name
+        mtime_ns: Report modification time, part of the cache key
+        size: Report size in bytes, part of the cache key
         
-        # Format message
-        message = format_report_message(
-            project.upper(),
-            execution_date,
-            total,
-            passed,
-            failed,
-            error,
-            config["report_link"]
-        )
-
-def format_report_message(display_name, execution_date, total, passed, failed, error, report_url):
+    Returns:
+        str: Formatted report message
+    """
+    config = PROJECT_CONFIG[project]
+    
+    # Extract report data with the same bounded scan as the summary reader
+    execution_date, total, passed, failed, error = _scan_summary(config["file_path"])
+    
+    # Format message
+    return format_report_message(
+        project.upper(),
+        execution_date,
+        total,
+        passed,
+        failed,
+        error,
+        config["shortened_link"]
+    )
+
+def format_report_message(display_name, execution_date, total, passed, failed, error, report_link):
     """Format the report message
     
     Args:
         display_name: Project display name
         execution_date: Test execution date
-        total: Total test count
+        total: Total test count, or None if unknown
         passed: Passed test count
         failed: Failed test count
         error: Error test count
-        report_url: URL for report
+        report_link: Pre-built Slack link to the report
         
     Returns:
         str: Formatted message
     """
-    # Create shortened link
-    report_link = shorten_link(report_url, "Xem báo cáo")
-    
     message = (
         f"====== REPORT {display_name} ======\n"
         f"Execution time: {execution_date}\n"
-        f"Total: {total}\n"
+        f"Total: {total if total is not None else 'N/A'}\n"
         f"Passed: {passed}\n"
         f"Failed: {failed}\n"
         f"Error: {error}\n"
@@ -95,79 +125,146 @@ def format_report_message(display_name, execution_date, total, passed, failed, e
     
     return message
 
-def extract_test_results(soup):
-    """Extract test results from HTML soup
+def _int_or_zero(text):
+    """Convert badge text to a count, treating anything non-numeric as 0"""
+    # Badges almost always hold a valid number, so let int() do the only scan
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+def extract_execution_date(html_content):
+    """Extract the execution date from report HTML
     
     Args:
-        soup: BeautifulSoup object
+        html_content: Report HTML as str or bytes
         
     Returns:
-        tuple: (total, passed, failed, error)
+        str: "%Y-%m-%d %H:%M:%S" date, or None if it cannot be found
     """
-    def get_count_text(class_name):
-        span = soup.find("span", class_=class_name)
-        if span:
-            text = span.get_text(strip=True)
-            return int(text) if text.isdigit() else 0
-        return 0
-    
-    total = get_total_tests(str(soup))
-    passed = get_count_text("success-badge")
-    failed = get_count_text("failure-badge")
-    error = get_count_text("error-badge")
+    return _scan_html(html_content)[0]
+
+def get_total_tests(html_content) -> Optional[int]:
+    """Extract the total test count from report HTML
     
-    return total, passed, failed, error
+    Args:
+        html_content: Report HTML as str or bytes
+        
+    Returns:
+        int: Total test count, or None if it cannot be found
+    """
+    return _scan_html(html_content)[1]
 
-def extract_execution_date(html_content):
-    soup = BeautifulSoup(html_content, "html.parser")
-    td = soup.find("td", class_="overview")
-    if not td:
-        return None
+def _scan_html(html_content):
+    """Run the summary scan over in-memory report HTML"""
+    if isinstance(html_content, str):
+        html_content = html_content.encode("utf-8")
+    return _scan_summary(io.BytesIO(html_content))
 
-    spans = td.find_all("span")
-    if len(spans) < 2:
+def _parse_execution_date(raw_date_text):
+    """Normalise the overview date text (e.g. "Run March 5 2025 at 14:30")
+    
+    Args:
+        raw_date_text: Text of the second overview span
+        
+    Returns:
+        str: "%Y-%m-%d %H:%M:%S" date, or None if it cannot be parsed
+    """
+    # Same format as strptime "%B %d %Y at %H:%M", without re-parsing the
+    # format string and consulting locale tables on every call
+    cleaned_date_text = " ".join(raw_date_text.split()[1:])
+    match = _DATE_RE.fullmatch(cleaned_date_text)
+    if not match:
+        # Reports that already carry an ISO date, e.g. "2025-03-05 14:30"
+        try:
+            dt = datetime.fromisoformat(cleaned_date_text)
+        except ValueError:
+            return None
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    month = _MONTHS.get(match[1].lower())
+    if month is None:
         return None
 
-    raw_date_text = spans[1].get_text(strip=True)
-
     try:
-        cleaned_date_text = " ".join(raw_date_text.split()[1:])
-        dt = datetime.strptime(cleaned_date_text, "%B %d %Y at %H:%M")
+        dt = datetime(int(match[3]), month, int(match[2]), int(match[4]), int(match[5]))
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except ValueError:
         return None
 
-def get_total_tests(html_content):
-    soup = BeautifulSoup(html_content, "html.parser")
-    overview = soup.select_one("td.overview")
-    if overview:
-        spans = overview.find_all("span")
-        if spans:
-            parts = spans[0].get_text().split()
-            if len(parts) > 0:
-                return parts[0]
-    return "N/A"
+def _parse_total(text) -> Optional[int]:
+    """Read the leading test count from the first overview span, e.g. "42 tests"
+    
+    Args:
+        text: Text of the first overview span
+        
+    Returns:
+        int: Total test count, or None if the text does not start with one
+    """
+    parts = text.split()
+    try:
+        return int(parts[0])
+    except (IndexError, ValueError):
+        return None
 
 def read_summary_report_html(file_path):
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    # Re-parse only when a new run rewrites the report
+    stat = os.stat(file_path)
+    return _read_summary_cached(file_path, stat.st_mtime_ns, stat.st_size)
 
-    soup = BeautifulSoup(content, "html.parser")
+@functools.lru_cache(maxsize=32)
+def _read_summary_cached(file_path, mtime_ns, size):
+    """Parse a summary report; mtime_ns and size only key the cache"""
+    return _scan_summary(file_path)
 
-    def get_count_text(class_name):
-        span = soup.find("span", class_=class_name)
-        if span:
-            text = span.get_text(strip=True)
-            return int(text) if text.isdigit() else 0
-        return 0
-
-    execution_date = extract_execution_date(content)
-    total = get_total_tests(content)
-    passed = get_count_text("success-badge")
-    failed = get_count_text("failure-badge")
-    error = get_count_text("error-badge")
-
-    return execution_date, total, passed, failed, error
+def _is_overview_span(span):
+    """Whether a span sits inside a td.overview cell"""
+    return any(
+        "overview" in td.get("class", "").split()
+        for td in span.iterancestors("td")
+    )
 
-def shorten_link(long_url: str, name_url: str) -> str:
-    return f"<{long_url}|{name_url}>"
+def _scan_summary(source):
+    """Stream a summary report and stop once every value has been seen
+    
+    Only span end events are handled and each span is cleared after use, so
+    the scan stops as soon as both overview spans and all three badges are
+    found instead of parsing the rest of a large report.
+    
+    Args:
+        source: Path to the HTML report, or a binary file object
+        
+    Returns:
+        tuple: (execution_date, total, passed, failed, error)
+    """
+    # Imported here so bot start-up does not pay for lxml until a report is read
+    from lxml import etree
+    
+    overview_texts = []
+    badges = {}
+    
+    try:
+        for _, span in etree.iterparse(source, events=("end",), tag="span", html=True):
+            text = "".join(span.itertext()).strip()
+            if len(overview_texts) < 2 and _is_overview_span(span):
+                overview_texts.append(text)
+            for class_name in span.get("class", "").split():
+                if class_name in _BADGE_CLASSES and class_name not in badges:
+                    badges[class_name] = _int_or_zero(text)
+            span.clear(keep_tail=True)
+            
+            if len(overview_texts) == 2 and len(badges) == len(_BADGE_CLASSES):
+                break
+    except etree.XMLSyntaxError:
+        # Empty or unreadable document: report whatever was found
+        pass
+    
+    total = _parse_total(overview_texts[0]) if overview_texts else None
+    execution_date = _parse_execution_date(overview_texts[1]) if len(overview_texts) > 1 else None
+    
+    return (
+        execution_date,
+        total,
+        badges.get("success-badge", 0),
+        badges.get("failure-badge", 0),
+        badges.get("error-badge", 0),
+    )